@@ -0,0 +1,113 @@
+"""
+Núcleo da enumeração de caminhos de `tarefa2_lista.py` compilado com Numba.
+
+Opera sobre a representação CSR (`indptr`, `indices`) construída por
+`Grafo.obter_csr`, com pilhas de inteiros pré-alocadas no lugar da recursão e um
+vetor de bytes para os vértices visitados, para que toda a busca rode em código
+nativo. `cache=True` guarda a compilação em disco entre execuções.
+
+É uma API em lote: `enumerar_caminhos` só retorna depois de encontrar todos os
+caminhos. Por isso `tarefa2_lista.py` a usa apenas em `calcular_caminhos_planos`,
+que materializa os caminhos de qualquer forma; o gerador
+`calcular_caminhos_possiveis` continua com a busca em Python, que produz cada
+caminho assim que o encontra.
+
+Este módulo importa `numba` no topo; `tarefa2_lista.py` só o importa quando o
+pacote está instalado.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def enumerar_caminhos(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    origem: int,
+    destino: int,
+    visitados: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Enumera todos os caminhos simples de `origem` até `destino` em um grafo CSR,
+    de uma só vez (a memória da saída cresce com o total de caminhos).
+
+    Cada caminho é descrito pelas posições CSR das arestas que o compõem, de onde
+    saem tanto o vértice (`indices[k]`) quanto o peso (`pesos[k]`) de cada passo.
+
+    Args:
+        indptr (np.ndarray): Início das arestas de cada vértice (int64, V + 1).
+        indices (np.ndarray): Destino de cada aresta (int64).
+        origem (int): Id do vértice de origem.
+        destino (int): Id do vértice de destino (diferente de `origem`).
+        visitados (np.ndarray): 1 para os vértices que não podem ser usados (uint8,
+            V). É alterado durante a busca e restaurado ao final.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: As posições das arestas de todos os caminhos,
+        concatenadas, e os deslocamentos em que cada caminho começa (o caminho `i`
+        ocupa `arestas[deslocamentos[i]:deslocamentos[i + 1]]`).
+    """
+    n = indptr.shape[0] - 1
+
+    # Pilha de vértices, próxima aresta de cada um e aresta usada em cada nível
+    pilha_v = np.empty(n, np.int64)
+    pilha_k = np.empty(n, np.int64)
+    caminho = np.empty(n, np.int64)
+
+    # Saída com crescimento geométrico
+    arestas = np.empty(16, np.int64)
+    deslocamentos = np.empty(16, np.int64)
+    deslocamentos[0] = 0
+    usados = 0
+    total = 0
+
+    topo = 0
+    pilha_v[0] = origem
+    pilha_k[0] = indptr[origem]
+    ja_visitada = visitados[origem]
+    visitados[origem] = 1
+
+    while topo >= 0:
+        u = pilha_v[topo]
+        k = pilha_k[topo]
+
+        # Arestas esgotadas: retroceder
+        if k == indptr[u + 1]:
+            visitados[u] = 0
+            topo -= 1
+            continue
+
+        pilha_k[topo] = k + 1
+        v = indices[k]
+        if visitados[v]:
+            continue
+
+        caminho[topo] = k
+
+        # Se chegamos ao destino, registramos o caminho e não descemos
+        if v == destino:
+            tamanho = topo + 1
+            if usados + tamanho > arestas.shape[0]:
+                novo = np.empty(max(2 * arestas.shape[0], usados + tamanho), np.int64)
+                novo[:usados] = arestas[:usados]
+                arestas = novo
+            arestas[usados : usados + tamanho] = caminho[:tamanho]
+            usados += tamanho
+
+            if total + 2 > deslocamentos.shape[0]:
+                novo = np.empty(2 * deslocamentos.shape[0], np.int64)
+                novo[: total + 1] = deslocamentos[: total + 1]
+                deslocamentos = novo
+            total += 1
+            deslocamentos[total] = usados
+            continue
+
+        # Descer para o próximo vértice
+        visitados[v] = 1
+        topo += 1
+        pilha_v[topo] = v
+        pilha_k[topo] = indptr[v]
+
+    visitados[origem] = ja_visitada
+    return arestas[:usados].copy(), deslocamentos[: total + 1].copy()
@@ -0,0 +1,95 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# distutils: language = c++
+"""
+Enumeração de caminhos de `tarefa2_matriz.py` como extensão Cython.
+
+Opera sobre a representação CSR (`indptr`, `indices`) de `Grafo.obter_csr`, com
+pilhas em `std::vector` e um vetor de bytes para os vértices visitados, sem
+objetos Python dentro do laço. É opcional: `tarefa2_matriz.py` só a usa se ela
+tiver sido compilada com `_grafo_ext_build.py`.
+
+É uma API em lote: `caminhos_em_arestas` só retorna depois de encontrar todos os
+caminhos. Por isso `tarefa2_matriz.py` a usa apenas em `calcular_caminhos_planos`;
+o gerador `iter_caminhos_possiveis` continua com a busca em Python, que produz cada
+caminho assim que o encontra.
+"""
+
+from array import array
+
+from libcpp.vector cimport vector
+
+
+def caminhos_em_arestas(
+    const long long[::1] indptr,
+    const long long[::1] indices,
+    long long origem,
+    long long destino,
+    unsigned char[::1] visitados,
+):
+    """
+    Enumera todos os caminhos simples de `origem` até `destino` em um grafo CSR,
+    de uma só vez (a memória da saída cresce com o total de caminhos).
+
+    Cada caminho é descrito pelas posições CSR das arestas que o compõem, de onde
+    saem tanto o vértice (`indices[k]`) quanto o peso (`pesos[k]`) de cada passo.
+
+    Args:
+        indptr (array): Início das arestas de cada vértice ('q', V + 1).
+        indices (array): Destino de cada aresta ('q').
+        origem (int): Id do vértice de origem.
+        destino (int): Id do vértice de destino (diferente de `origem`).
+        visitados (bytearray): 1 para os vértices que não podem ser usados (V). É
+            alterado durante a busca e restaurado ao final.
+
+    Returns:
+        tuple[array, array]: As posições das arestas de todos os caminhos,
+        concatenadas, e os deslocamentos em que cada caminho começa (o caminho `i`
+        ocupa `arestas[deslocamentos[i]:deslocamentos[i + 1]]`).
+    """
+    # Pilha de vértices, próxima aresta de cada um e aresta usada em cada nível
+    cdef vector[long long] pilha_v
+    cdef vector[long long] pilha_k
+    cdef vector[long long] caminho
+    cdef vector[long long] arestas
+    cdef vector[long long] deslocamentos
+    cdef long long u, v, k
+    cdef unsigned char ja_visitada = visitados[origem]
+
+    deslocamentos.push_back(0)
+    pilha_v.push_back(origem)
+    pilha_k.push_back(indptr[origem])
+    visitados[origem] = 1
+
+    while not pilha_v.empty():
+        u = pilha_v.back()
+        k = pilha_k.back()
+
+        # Arestas esgotadas: retroceder
+        if k == indptr[u + 1]:
+            visitados[u] = 0
+            pilha_v.pop_back()
+            pilha_k.pop_back()
+            if not caminho.empty():
+                caminho.pop_back()
+            continue
+
+        pilha_k[pilha_k.size() - 1] = k + 1
+        v = indices[k]
+        if visitados[v]:
+            continue
+
+        # Se chegamos ao destino, registramos o caminho e não descemos
+        if v == destino:
+            arestas.insert(arestas.end(), caminho.begin(), caminho.end())
+            arestas.push_back(k)
+            deslocamentos.push_back(arestas.size())
+            continue
+
+        # Descer para o próximo vértice
+        caminho.push_back(k)
+        visitados[v] = 1
+        pilha_v.push_back(v)
+        pilha_k.push_back(indptr[v])
+
+    visitados[origem] = ja_visitada
+    return array("q", arestas), array("q", deslocamentos)
@@ -0,0 +1,35 @@
+"""
+Compila a extensão Cython `_grafo_ext` (ver `_grafo_ext.pyx`).
+
+A extensão é opcional: sem ela, `tarefa2_matriz.py` usa a busca em Python puro.
+Com ela, a enumeração em lote de `calcular_caminhos_planos` roda em C++, sem
+objetos Python no laço.
+
+Uso, a partir deste diretório (requer `cython`, `setuptools` e um compilador C++):
+    python _grafo_ext_build.py
+
+O arquivo `_grafo_ext.*.so` (ou `.pyd`) é gerado ao lado deste script. A opção
+`-O3` é de GCC/Clang; o binário não usa instruções específicas da CPU, então pode
+ser copiado para outras máquinas da mesma plataforma.
+"""
+
+import os
+import sys
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+diretorio = os.path.dirname(os.path.abspath(__file__))
+extensao = Extension(
+    "_grafo_ext",
+    [os.path.join(diretorio, "_grafo_ext.pyx")],
+    extra_compile_args=[] if sys.platform == "win32" else ["-O3"],
+)
+
+if __name__ == "__main__":
+    os.chdir(diretorio)
+    setup(
+        name="_grafo_ext",
+        ext_modules=cythonize([extensao]),
+        script_args=["build_ext", "--inplace"],
+    )
@@ -0,0 +1,67 @@
+"""
+Núcleo do algoritmo de Dijkstra compilado com Numba.
+
+Opera sobre a representação CSR (`indptr`, `indices`, `pesos`) construída por
+`CalculadoraDeGrafo`, usando apenas inteiros e floats para que todo o laço rode
+em código nativo. A assinatura explícita faz a compilação acontecer na
+importação do módulo (e `cache=True` a guarda em disco), evitando a latência
+da primeira chamada.
+
+Este módulo importa `numba` no topo; `tarefa1.py` só o importa quando o pacote
+está instalado.
+"""
+
+import heapq
+
+import numpy as np
+from numba import float64, int64, njit
+from numba.types import Tuple
+
+
+@njit(
+    Tuple((float64[:], int64[:]))(int64[:], int64[:], float64[:], int64, int64),
+    cache=True,
+)
+def dijkstra(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    pesos: np.ndarray,
+    origem: int,
+    n: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula as distâncias mínimas a partir de `origem` em um grafo CSR.
+
+    Args:
+        indptr (np.ndarray): Início da lista de vizinhos de cada vértice (int64, n + 1).
+        indices (np.ndarray): Vizinhos de cada vértice, concatenados (int64).
+        pesos (np.ndarray): Peso de cada arco, alinhado com `indices` (float64).
+        origem (int): Índice do vértice de origem.
+        n (int): Número de vértices.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: As distâncias (inf se inalcançável) e o
+        predecessor de cada vértice (-1 para a origem e os inalcançáveis).
+    """
+    distancias = np.full(n, np.inf)
+    predecessores = np.full(n, -1, np.int64)
+    visitados = np.zeros(n, np.bool_)
+
+    distancias[origem] = 0.0
+    fila = [(0.0, origem)]
+
+    while len(fila) > 0:
+        distancia_atual, u = heapq.heappop(fila)
+        if visitados[u]:
+            continue
+        visitados[u] = True
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            distancia_tentativa = distancia_atual + pesos[k]
+            if distancia_tentativa < distancias[v]:
+                distancias[v] = distancia_tentativa
+                predecessores[v] = u
+                heapq.heappush(fila, (distancia_tentativa, v))
+
+    return distancias, predecessores
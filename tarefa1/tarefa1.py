@@ -9,7 +9,7 @@ Classes Principais
 
 - `Vertice`: Representa um vértice no grafo.
 - `Arco`: Representa uma aresta (arco) ponderada entre dois vértices.
-- `ListaDeVertices`: Uma coleção de vértices, armazenados em um conjunto para garantir unicidade.
+- `ListaDeVertices`: Uma coleção de vértices, armazenados em um dicionário para garantir unicidade e ordem.
 - `MapaDeArcos`: Um mapa de arcos entre pares de vértices, armazenados em um dicionário.
 - `Grafo`: Representa o grafo completo, contendo vértices e arcos.
 
@@ -17,8 +17,9 @@ Uso Básico
 ----------
 
 Para criar um grafo, instancie a classe `Grafo` e use o método `g` para adicionar vértices e arcos.
-Você pode visualizar a matriz de adjacência do grafo chamando o método `mostrar_matriz_adjacencia`.
-Para uma visualização gráfica interativa, use o método `visualizar_grafo`.
+Você pode visualizar a matriz de adjacência do grafo chamando a função `mostrar_matriz_adjacencia`
+(usa `rich`, se instalado). Para uma visualização gráfica interativa, use a função `visualizar_grafo`
+(requer `pyvis`). Ambos os pacotes são importados apenas na primeira renderização.
 
 Exemplo:
 
@@ -47,24 +48,146 @@ Para mais detalhes sobre cada classe e seus métodos, consulte as docstrings ind
 
 from __future__ import annotations
 
+import functools
+import heapq
+import importlib.util
+import math
 import os
+import sys
 import timeit
-from collections.abc import Iterator, MutableSequence, MutableSet, Sequence, ValuesView
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    ValuesView,
+)
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
-# region imports condicionais
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from pyvis.network import Network
+    from scipy.sparse import csr_matrix
+    from rich.console import Console
+    from rich.table import Table
 
 type DirecaoArco = Literal["bidirecional", "origem", "destino", "sem_direcao"]
 type PesoArco = float
+type TuplaArco = (
+    tuple[Vertice, Vertice, PesoArco, DirecaoArco]
+    | tuple[Vertice, Vertice, PesoArco]
+    | tuple[Vertice, Vertice]
+)
+type EstrategiaDijkstra = Literal["auto", "heap", "bucket"]
+
+_INF = math.inf
+"""Distância de vértices inalcançáveis."""
+
+_FATOR_BALDES = 4
+"""
+Na estratégia "auto", a fila de baldes só é usada se o maior peso for no máximo
+`_FATOR_BALDES * (V + E)`: com pesos maiores, o vetor de `C + 1` baldes e a sua
+varredura passam a custar mais que o heap.
+"""
+
+
+# region imports opcionais
+@functools.lru_cache(maxsize=1)
+def _get_rich() -> tuple[type[Console], type[Table]] | None:
+    """
+    Importa `rich` sob demanda, apenas na primeira renderização.
+
+    Retorna:
+        tuple[type[Console], type[Table]] | None: As classes `Console` e `Table`,
+        ou None se o pacote `rich` não estiver instalado.
+    """
+    if importlib.util.find_spec("rich") is None:
+        return None
+
+    from rich.console import Console
+    from rich.table import Table
+
+    return Console, Table
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pyvis() -> type[Network] | None:
+    """
+    Importa `pyvis` sob demanda, apenas na primeira visualização.
+
+    Retorna:
+        type[Network] | None: A classe `Network`, ou None se o pacote `pyvis`
+        não estiver instalado.
+    """
+    if importlib.util.find_spec("pyvis") is None:
+        return None
+
+    from pyvis.network import Network
+
+    return Network
+
+
+@functools.lru_cache(maxsize=1)
+def _get_scipy() -> tuple[type[csr_matrix], Callable[..., Any]] | None:
+    """
+    Importa `scipy.sparse` sob demanda, apenas no primeiro cálculo em lote.
+
+    Retorna:
+        tuple[type[csr_matrix], Callable[..., Any]] | None: A classe `csr_matrix`
+        e a função `scipy.sparse.csgraph.dijkstra`, ou None se o pacote `scipy`
+        não estiver instalado.
+    """
+    if importlib.util.find_spec("scipy") is None:
+        return None
+
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra
+
+    return csr_matrix, dijkstra
+
+
+@functools.lru_cache(maxsize=1)
+def _get_dijkstra_numba() -> Callable[..., tuple[NDArray[Any], NDArray[Any]]] | None:
+    """
+    Importa o Dijkstra compilado com Numba (`_dijkstra_numba`) sob demanda.
+
+    A assinatura explícita e `cache=True` do `@njit` fazem a compilação acontecer
+    uma única vez e ficar guardada em disco, então as execuções seguintes não têm
+    latência de compilação.
+
+    Retorna:
+        Callable | None: A função `_dijkstra_numba.dijkstra`, ou None se o pacote
+        `numba` não estiver instalado ou o módulo não puder ser importado.
+    """
+    if importlib.util.find_spec("numba") is None:
+        return None
+
+    # Sem `tarefa1/` no `sys.path` (por exemplo, importado como `tarefa1.tarefa1`),
+    # o módulo não é encontrado e o heap em Python puro é usado
+    try:
+        from _dijkstra_numba import dijkstra
+    except ImportError:
+        return None
+
+    return dijkstra
+
+
+# endregion
 
 
 # region funções
+_CONSTRUTORES_ARCO: dict[int, Callable[[Vertice, Vertice, TuplaArco], Arco]] = {
+    2: lambda v1, v2, _: Arco(origem=v1, destino=v2),
+    3: lambda v1, v2, tup: Arco(origem=v1, destino=v2, peso=tup[2]),
+    4: lambda v1, v2, tup: Arco(origem=v1, destino=v2, peso=tup[2], direcao=tup[3]),
+}
+"""Construtores de `Arco` indexados pelo tamanho da tupla recebida em `g`."""
+
+
 def g(
     grafo: Grafo,
-    *_to: tuple[Vertice, Vertice, PesoArco, DirecaoArco]
-    | tuple[Vertice, Vertice, PesoArco]
-    | tuple[Vertice, Vertice],
+    *_to: TuplaArco,
 ) -> None:
     """
     Adiciona vértices e arcos ao grafo a partir de uma lista de tuplas.
@@ -86,10 +209,11 @@ def g(
         >>> grafo.g((v1, v2, arco))
         >>> len(grafo.vertices)
         2
-        >>> grafo.arcos.arcos[(v1, v2)].peso
+        >>> grafo.arcos.obter(v2, v1).peso
         1.5
     """
 
+    novos: list[tuple[Vertice, Vertice, Arco]] = []
     for tup in _to:
         if (v1 := tup[0]) not in grafo.vertices:
             raise ValueError(
@@ -103,16 +227,17 @@ def g(
                 "Primeiro, você deve criar o vértice."
             )
 
-        arco = (
-            (Arco(origem=v1, destino=v2, peso=tup[2], direcao=tup[3]))
-            if len(tup) == 4
-            else Arco(origem=v1, destino=v2, peso=tup[2], direcao="sem_direcao")
-            if len(tup) == 3
-            else Arco(origem=v1, destino=v2, peso=1.0, direcao="sem_direcao")
-        )
+        if (construtor := _CONSTRUTORES_ARCO.get(len(tup))) is None:
+            raise ValueError("Tupla de arco deve ter 2, 3 ou 4 elementos.")
+
+        arco = construtor(v1, v2, tup)
+
+        # Arcos simétricos são guardados uma única vez pelo mapa de arcos
+        novos.append((v1, v2, arco))
+        if not arco.simetrico:
+            novos.append((v2, v1, arco))
 
-        grafo.arcos.criar(v1, v2, arco)
-        grafo.arcos.criar(v2, v1, arco)
+    grafo.arcos.bulk_add(novos)
 
 
 def mostrar_matriz_adjacencia(grafo: Grafo, clear_screen: bool = False) -> None:
@@ -145,7 +270,7 @@ def mostrar_matriz_adjacencia(grafo: Grafo, clear_screen: bool = False) -> None:
     if clear_screen:
         os.system("cls" if os.name == "nt" else "clear")
 
-    vertices_ordenados = sorted(list(grafo.vertices.vertices))
+    vertices_ordenados = grafo.vertices.ordenados()
     n = len(vertices_ordenados)
 
     if n == 0:
@@ -153,39 +278,94 @@ def mostrar_matriz_adjacencia(grafo: Grafo, clear_screen: bool = False) -> None:
         print("Grafo vazio")
         return
 
-    # Exibição tradicional se rich não estiver disponível
+    if (rich_mod := _get_rich()) is not None:
+        Console, Table = rich_mod
+        tabela = Table(title="Matriz de Adjacência")
+        tabela.add_column("")
+        for v in vertices_ordenados:
+            tabela.add_column(v.id, justify="center")
+
+        for v1 in vertices_ordenados:
+            celulas: list[str] = []
+            for v2 in vertices_ordenados:
+                arco = grafo.arcos.obter(v1, v2)
+                celulas.append(f"{arco.peso:.1f}" if arco else "null")
+            tabela.add_row(v1.id, *celulas)
+
+        Console().print(tabela)
+        return
+
+    # Exibição tradicional se rich não estiver disponível.
+    # Toda a matriz é montada em memória e escrita de uma só vez, e o texto fica
+    # guardado no grafo até que vértices ou arcos sejam adicionados.
+    chave = (n, grafo.arcos._versao)
+    if grafo._cache_matriz is not None and grafo._cache_matriz[0] == chave:
+        sys.stdout.write(grafo._cache_matriz[1])
+        return
+
+    obter = grafo.arcos.obter
     largura_rotulo = max(len(v.id) for v in vertices_ordenados)
     largura_valor = max(4, len("null"))
+    borda = "=" * (largura_rotulo + 1) + "+" + "=" * ((largura_valor + 1) * n - 1)
+    divisoria = "-" * (largura_rotulo + 1) + "+" + "-" * ((largura_valor + 1) * n - 1)
 
-    print("\n=== Matriz de Adjacência ===")
-    print(" " * (largura_rotulo + 1), end="")
-    for v in vertices_ordenados:
-        print(f"{v.id:^{largura_valor}}", end=" ")
-    print()
-
-    print("=" * (largura_rotulo + 1) + "+" + "=" * ((largura_valor + 1) * n - 1))
+    linhas = [
+        "",
+        "=== Matriz de Adjacência ===",
+        " " * (largura_rotulo + 1)
+        + "".join(f"{v.id:^{largura_valor}} " for v in vertices_ordenados),
+        borda,
+    ]
 
     for v1 in vertices_ordenados:
-        print(f"{v1.id:<{largura_rotulo}}", end=" │")
-        for v2 in vertices_ordenados:
-            arco = grafo.arcos.arcos.get((v1, v2))
-            valor = f"{arco.peso:.1f}" if arco else "null"
-            print(f"{valor:^{largura_valor}}", end=" ")
-        print()
-
-        if v1 != vertices_ordenados[-1]:
-            print(
-                "-" * (largura_rotulo + 1) + "+" + "-" * ((largura_valor + 1) * n - 1)
-            )
+        valores = [
+            f"{arco.peso:.1f}" if arco else "null"
+            for arco in [obter(v1, v2) for v2 in vertices_ordenados]
+        ]
+        celulas = "".join(f"{valor:^{largura_valor}} " for valor in valores)
+        linhas.append(f"{v1.id:<{largura_rotulo}} │{celulas}")
+        linhas.append(divisoria)
+
+    # A última divisória dá lugar à borda final
+    linhas[-1] = borda
+    texto = "\n".join(linhas) + "\n"
+    object.__setattr__(grafo, "_cache_matriz", (chave, texto))
+    sys.stdout.write(texto)
+
+
+def visualizar_grafo(grafo: Grafo, arquivo: str = "grafo.html") -> None:
+    """
+    Gera uma visualização interativa do grafo em HTML usando `pyvis`.
+
+    Parâmetros:
+        grafo (Grafo): O grafo a ser visualizado.
+        arquivo (str): Caminho do arquivo HTML gerado. Padrão é "grafo.html".
+
+    Retorna:
+        None
+
+    Levanta:
+        RuntimeError: Se o pacote `pyvis` não estiver instalado.
+    """
+    Network = _get_pyvis()
+    if Network is None:
+        raise RuntimeError("O pacote pyvis é necessário para visualizar o grafo.")
+
+    rede = Network()
+    for v in grafo.vertices:
+        rede.add_node(v.id, label=v.id)
 
-    print("=" * (largura_rotulo + 1) + "+" + "=" * ((largura_valor + 1) * n - 1))
+    for arco in grafo.arcos.values():
+        rede.add_edge(arco.origem.id, arco.destino.id, value=arco.peso)
+
+    rede.write_html(arquivo)
 
 
 # endregion
 
 
 # region vertice
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Vertice:
     """
     Representa um vértice em um grafo.
@@ -203,6 +383,20 @@ class Vertice:
     >>> Vertice("A")
     """
 
+    def __post_init__(self) -> None:
+        # Internar o id para que comparações entre ids iguais sejam por identidade
+        object.__setattr__(self, "id", sys.intern(self.id))
+
+    def __hash__(self) -> int:
+        """Hash direto do id, sem montar a tupla de campos do dataclass."""
+        return hash(self.id)
+
+    def __eq__(self, other: object) -> bool:
+        """Compara diretamente os ids, sem montar a tupla de campos do dataclass."""
+        if isinstance(other, Vertice):
+            return self.id == other.id
+        return NotImplemented
+
     def __format__(self, format_spec: str) -> str:
         """
         Formata o vértice de acordo com a especificação de formato fornecida.
@@ -233,25 +427,21 @@ class Vertice:
             >>> f"{v:3}"
             'A  '  # padded to width 3
         """
-        try:
-            width = int(format_spec)
-            return f"{self.id:{width}}"
-        except ValueError:
-            if not format_spec or format_spec == "n":
-                return self.id
-            elif format_spec == "f":
-                return f"{self.id} (id={self.id})"
-            elif format_spec == "i":
-                return self.id
-            else:
-                raise ValueError(f"Unknown format code '{format_spec}' for Vertice")
+        # Os códigos conhecidos são testados antes, sem passar por exceções
+        if not format_spec or format_spec == "n" or format_spec == "i":
+            return self.id
+        if format_spec == "f":
+            return f"{self.id} (id={self.id})"
+        if format_spec.isdigit():
+            return f"{self.id:{int(format_spec)}}"
+        raise ValueError(f"Unknown format code '{format_spec}' for Vertice")
 
 
 # endregion
 
 
 # region arco
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Arco:
     """
     Representa uma aresta (arco) entre dois vértices em um grafo.
@@ -259,13 +449,21 @@ class Arco:
     Esta classe é imutável (frozen).
 
     Atributos:
+        origem (Vertice): O vértice de origem.
+        destino (Vertice): O vértice de destino.
+        direcao (DirecaoArco): A direção do arco. Valor padrão é "sem_direcao".
         peso (float): O peso da aresta. Valor padrão é 1.0.
     """
 
     origem: Vertice
     destino: Vertice
-    direcao: DirecaoArco = field(default_factory=lambda: "sem_direcao")
-    peso: float = field(default=1.0)
+    direcao: DirecaoArco = "sem_direcao"
+    peso: PesoArco = 1.0
+
+    @property
+    def simetrico(self) -> bool:
+        """Se o arco vale nos dois sentidos ("sem_direcao" ou "bidirecional")."""
+        return self.direcao in ("sem_direcao", "bidirecional")
 
 
 # endregion
@@ -277,13 +475,18 @@ class ListaDeVertices:
     """
     Representa uma coleção de vértices em um grafo.
 
-    Utiliza um conjunto para armazenar os vértices, garantindo unicidade.
+    Utiliza um dicionário para armazenar os vértices, garantindo unicidade e
+    preservando a ordem de inserção. O valor associado a cada vértice é o seu
+    índice de inserção.
 
     Atributos:
-        vertices (set[Vertice]): Conjunto de vértices.
+        vertices (dict[Vertice, int]): Mapa de cada vértice para o seu índice.
     """
 
-    vertices: set[Vertice] = field(default_factory=set)
+    vertices: dict[Vertice, int] = field(default_factory=dict)
+    _cache_ordenados: list[Vertice] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def verificar_existencia(self, _v: Vertice, /) -> bool:
         """Verifica se um vertice existe dentro da lista.
@@ -313,7 +516,83 @@ class ListaDeVertices:
             >>> len(lista.vertices)
             1
         """
-        self.vertices.add(_v)
+        if _v not in self.vertices:
+            self.vertices[_v] = len(self.vertices)
+            object.__setattr__(self, "_cache_ordenados", None)
+
+    def bulk_add(self, vs: Iterable[Vertice], /) -> None:
+        """
+        Adiciona vários vértices de uma só vez.
+
+        Os novos vértices são reunidos em um dicionário montado por compreensão e
+        mesclados com um único `update`, que já dimensiona a tabela para o total
+        em vez de crescer por rehash a cada inserção. Vértices repetidos ou já
+        presentes são ignorados, como em `criar`.
+
+        Parâmetros:
+            vs (Iterable[Vertice]): Os vértices a serem adicionados.
+
+        Retorna:
+            None
+
+        Exemplo:
+            >>> lista = ListaDeVertices()
+            >>> lista.bulk_add([Vertice("A"), Vertice("B"), Vertice("A")])
+            >>> lista.indice_de(Vertice("B"))
+            1
+        """
+        vertices = self.vertices
+        novos = [v for v in dict.fromkeys(vs) if v not in vertices]
+        if not novos:
+            return
+        inicio = len(vertices)
+        vertices.update({v: inicio + i for i, v in enumerate(novos)})
+        object.__setattr__(self, "_cache_ordenados", None)
+
+    def indice_de(self, _v: Vertice, /) -> int:
+        """
+        Retorna o índice de inserção de um vértice.
+
+        Parâmetros:
+            _v (Vertice): O vértice consultado (parâmetro apenas posicional).
+
+        Retorna:
+            int: O índice do vértice, entre 0 e len(lista) - 1.
+
+        Levanta:
+            KeyError: Se o vértice não estiver na coleção.
+
+        Exemplo:
+            >>> lista = ListaDeVertices()
+            >>> lista.criar(Vertice("B"))
+            >>> lista.criar(Vertice("A"))
+            >>> lista.indice_de(Vertice("A"))
+            1
+        """
+        return self.vertices[_v]
+
+    def ordenados(self) -> list[Vertice]:
+        """
+        Retorna os vértices em ordem crescente.
+
+        A lista ordenada é mantida em cache até o próximo `criar`. Não deve ser
+        modificada por quem a recebe.
+
+        Retorna:
+            list[Vertice]: Os vértices ordenados pelo id.
+
+        Exemplo:
+            >>> lista = ListaDeVertices()
+            >>> lista.criar(Vertice("B"))
+            >>> lista.criar(Vertice("A"))
+            >>> [v.id for v in lista.ordenados()]
+            ['A', 'B']
+        """
+        ordenados = self._cache_ordenados
+        if ordenados is None:
+            ordenados = sorted(self.vertices)
+            object.__setattr__(self, "_cache_ordenados", ordenados)
+        return ordenados
 
     def __iter__(self) -> Iterator[Vertice]:
         """
@@ -333,8 +612,7 @@ class ListaDeVertices:
             A
             B
         """
-        for el in self.vertices:
-            yield el
+        return iter(self.vertices)
 
     def __contains__(self, item: Vertice) -> bool:
         return item in self.vertices
@@ -358,12 +636,17 @@ class MapaDeArcos:
     Representa um mapa de arestas (arcos) entre pares de vértices em um grafo.
 
     Utiliza um dicionário para armazenar os arcos, com chaves sendo tuplas de vértices.
+    Arcos simétricos (ver `Arco.simetrico`) são guardados uma única vez, na chave
+    canônica (menor vértice, maior vértice), e encontrados nos dois sentidos por
+    `obter`, `__get_item__` e `__contains__`.
 
     Atributos:
         arcos (dict[tuple[Vertice, Vertice], Arco]): Dicionário de arcos.
     """
 
     arcos: dict[tuple[Vertice, Vertice], Arco] = field(default_factory=dict)
+    _versao: int = field(default=0, init=False, repr=False, compare=False)
+    """Incrementada a cada `criar`/`__set_item__`; usada para invalidar caches."""
 
     def criar(self, v1: Vertice, v2: Vertice, arco: Arco) -> None:
         """
@@ -382,11 +665,91 @@ class MapaDeArcos:
             >>> v1 = Vertice("A")
             >>> v2 = Vertice("B")
             >>> arco = Arco(peso=2.5)
-            >>> mapa.criar(v1, v2, arco)
+            >>> mapa.criar(v2, v1, arco)
             >>> mapa.arcos[(v1, v2)].peso
             2.5
         """
-        self.arcos[(v1, v2)] = arco
+        if arco.simetrico:
+            chave = self._chave(v1, v2)
+            # O arco simétrico substitui um arco direcionado no sentido inverso
+            self.arcos.pop((chave[1], chave[0]), None)
+        else:
+            chave = (v1, v2)
+        self.arcos[chave] = arco
+        object.__setattr__(self, "_versao", self._versao + 1)
+
+    def bulk_add(self, items: Iterable[tuple[Vertice, Vertice, Arco]], /) -> None:
+        """
+        Adiciona vários arcos de uma só vez.
+
+        Equivale a chamar `criar` para cada tupla, mas monta as novas entradas em
+        um dicionário e as mescla com um único `update`, evitando os rehashes
+        intermediários. Assim como em `criar`, um arco simétrico remove o arco
+        direcionado guardado no sentido inverso.
+
+        Parâmetros:
+            items (Iterable[tuple[Vertice, Vertice, Arco]]): Tuplas (v1, v2, arco).
+
+        Retorna:
+            None
+
+        Exemplo:
+            >>> mapa = MapaDeArcos()
+            >>> v1 = Vertice("A")
+            >>> v2 = Vertice("B")
+            >>> mapa.bulk_add([(v1, v2, Arco(v1, v2, peso=2.5))])
+            >>> mapa.obter(v2, v1).peso
+            2.5
+        """
+        chave = self._chave
+        novos: dict[tuple[Vertice, Vertice], Arco] = {}
+        removidos: set[tuple[Vertice, Vertice]] = set()
+        for v1, v2, arco in items:
+            if arco.simetrico:
+                v1, v2 = chave(v1, v2)
+                # Assim como em `criar`, descarta o arco no sentido inverso
+                if v1 != v2:
+                    novos.pop((v2, v1), None)
+                    removidos.add((v2, v1))
+            novos[(v1, v2)] = arco
+            removidos.discard((v1, v2))
+        if novos:
+            for inversa in removidos:
+                self.arcos.pop(inversa, None)
+            self.arcos.update(novos)
+            object.__setattr__(self, "_versao", self._versao + 1)
+
+    @staticmethod
+    def _chave(v1: Vertice, v2: Vertice) -> tuple[Vertice, Vertice]:
+        """Retorna a chave canônica de um arco simétrico entre `v1` e `v2`."""
+        return (v1, v2) if v1 <= v2 else (v2, v1)
+
+    def obter(self, v1: Vertice, v2: Vertice) -> Arco | None:
+        """
+        Retorna o arco de `v1` para `v2`, se existir.
+
+        Parâmetros:
+            v1 (Vertice): O primeiro vértice.
+            v2 (Vertice): O segundo vértice.
+
+        Retorna:
+            Arco | None: O arco guardado em (v1, v2), ou o arco simétrico guardado
+            em (v2, v1), ou None se os vértices não forem adjacentes.
+
+        Exemplo:
+            >>> mapa = MapaDeArcos()
+            >>> v1 = Vertice("A")
+            >>> v2 = Vertice("B")
+            >>> mapa.criar(v1, v2, Arco(v1, v2, peso=2.5))
+            >>> mapa.obter(v2, v1).peso
+            2.5
+        """
+        arco = self.arcos.get((v1, v2))
+        if arco is None:
+            arco = self.arcos.get((v2, v1))
+            if arco is not None and not arco.simetrico:
+                return None
+        return arco
 
     def values(self) -> ValuesView[Arco]:
         """
@@ -408,7 +771,9 @@ class MapaDeArcos:
         return self.arcos.values()
 
     def __get_item__(self, item: tuple[Vertice, Vertice]) -> Arco:
-        return self.arcos[item]
+        if (arco := self.obter(*item)) is None:
+            raise KeyError(item)
+        return arco
 
     def __set_item__(self, key: tuple[Vertice, Vertice], new_val: Arco) -> None:
         """
@@ -432,10 +797,10 @@ class MapaDeArcos:
             >>> mapa.arcos[(v1, v2)].peso
             2.0
         """
-        self.arcos[key] = new_val
+        self.criar(*key, new_val)
 
     def __contains__(self, item: tuple[Vertice, Vertice]) -> bool:
-        return item in self.arcos
+        return self.obter(*item) is not None
 
 
 # endregion
@@ -467,6 +832,32 @@ class Grafo:
 
     vertices: ListaDeVertices = field(default_factory=ListaDeVertices)
     arcos: MapaDeArcos = field(default_factory=MapaDeArcos)
+    _cache_matriz: tuple[tuple[int, int], str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Última matriz de adjacência renderizada, com a (ordem, versão dos arcos) usada."""
+
+
+class GrafoView(NamedTuple):
+    """
+    Visão imutável do grafo em formato CSR, para os algoritmos vetorizados.
+
+    Os vizinhos do vértice de índice `i` são `indices[indptr[i]:indptr[i + 1]]`,
+    com os pesos correspondentes em `weights`.
+
+    Atributos:
+        n (int): O número de vértices.
+        idx (dict[Vertice, int]): O índice de cada vértice, na ordem de inserção.
+        indptr (NDArray): Início da vizinhança de cada vértice (int64, tamanho n + 1).
+        indices (NDArray): Índice do destino de cada arco (int64).
+        weights (NDArray): Peso de cada arco (float64).
+    """
+
+    n: int
+    idx: dict[Vertice, int]
+    indptr: NDArray[Any]
+    indices: NDArray[Any]
+    weights: NDArray[Any]
 
 
 # endregion
@@ -476,9 +867,362 @@ class Grafo:
 @dataclass(frozen=True)
 class CalculadoraDeGrafo:
     grafo: Grafo
+    _cache_dijkstra: dict[Vertice, tuple[dict[int, float], dict[int, int]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _cache_caminhos: dict[tuple[Vertice, Vertice], tuple[float, tuple[str, ...]]] = (
+        field(default_factory=dict, init=False, repr=False, compare=False)
+    )
+    _versao_caches: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Versão do grafo (ver `_validar_caches`) em que os caches foram montados."""
+
+    _PROPRIEDADES_EM_CACHE = (
+        "_adj",
+        "_vertices",
+        "_por_id",
+        "_adj_indices",
+        "_view",
+        "_pesos_inteiros",
+        "_peso_maximo_inteiro",
+        "_tamanho",
+    )
+    """As `cached_property` derivadas do grafo, descartadas por `_validar_caches`."""
 
-    def calcular_caminho_minimo_dijkstra(
+    def _validar_caches(self) -> None:
+        """
+        Descarta os caches da calculadora se o grafo mudou desde que foram montados.
+
+        A versão do grafo é o número de vértices junto com `MapaDeArcos._versao`, a
+        mesma chave usada por `mostrar_matriz_adjacencia`. Os métodos públicos chamam
+        este método antes de consultar qualquer cache.
+        """
+        versao = (len(self.grafo.vertices), self.grafo.arcos._versao)
+        if self._versao_caches == versao:
+            return
+
+        for nome in self._PROPRIEDADES_EM_CACHE:
+            self.__dict__.pop(nome, None)
+        self._cache_dijkstra.clear()
+        self._cache_caminhos.clear()
+        object.__setattr__(self, "_versao_caches", versao)
+
+    @functools.cached_property
+    def _adj(self) -> dict[Vertice, list[tuple[Vertice, Arco]]]:
+        """
+        Lista de adjacência do grafo, construída no primeiro uso.
+
+        Mapeia cada vértice para os pares (vizinho, arco) que saem dele. A lista
+        reflete o grafo no momento da construção e é descartada por
+        `_validar_caches` se vértices ou arcos forem adicionados depois.
+        """
+        adj: dict[Vertice, list[tuple[Vertice, Arco]]] = {
+            v: [] for v in self.grafo.vertices
+        }
+        for (u, v), arco in self.grafo.arcos.arcos.items():
+            adj[u].append((v, arco))
+            # Arcos simétricos são guardados uma única vez no mapa de arcos
+            if arco.simetrico and u != v:
+                adj[v].append((u, arco))
+        return adj
+
+    @functools.cached_property
+    def _vertices(self) -> list[Vertice]:
+        """
+        Os vértices do grafo indexados pela ordem de inserção, isto é, o inverso
+        de `ListaDeVertices.indice_de`. Assim como `_adj`, é descartado por
+        `_validar_caches` quando o grafo muda.
+        """
+        return list(self.grafo.vertices)
+
+    @functools.cached_property
+    def _por_id(self) -> dict[str, Vertice]:
+        """Mapa do id de cada vértice para o próprio vértice, o inverso de `Vertice.id`."""
+        return {v.id: v for v in self._vertices}
+
+    @functools.cached_property
+    def _adj_indices(self) -> list[list[tuple[int, float]]]:
+        """
+        Lista de adjacência por índice de vértice, construída a partir de `_adj`.
+
+        A posição `i` contém os pares (índice do vizinho, peso) que saem do vértice
+        `_vertices[i]`. Os algoritmos internos trabalham sobre ela para que cada
+        acesso seja uma indexação de lista e um hash de inteiro, em vez de chamar
+        `Vertice.__hash__`/`__eq__`.
+        """
+        indice = self.grafo.vertices.vertices
+        return [
+            [(indice[v], arco.peso) for v, arco in self._adj[u]] for u in self._vertices
+        ]
+
+    @functools.cached_property
+    def _view(self) -> GrafoView:
+        """
+        Visão CSR do grafo (ver `GrafoView`), construída no primeiro uso.
+
+        É montada direto do mapa de arcos em duas passadas: a primeira conta o grau
+        de saída de cada vértice, cuja soma acumulada dá `indptr`; a segunda
+        preenche `indices` e `weights` na posição de cada arco. A ordem dos
+        vizinhos é a mesma de `_adj`. É compartilhada pelo Dijkstra compilado e
+        pelo caminho com `scipy`, e, assim como `_adj`, reflete o grafo no momento
+        da construção.
+        """
+        import numpy as np
+
+        idx = dict(self.grafo.vertices.vertices)
+        n = len(idx)
+        arcos = [
+            (idx[u], idx[v], arco.peso, arco.simetrico and u != v)
+            for (u, v), arco in self.grafo.arcos.arcos.items()
+        ]
+
+        # Primeira passada: grau de saída de cada vértice
+        graus = np.zeros(n + 1, dtype=np.int64)
+        for u, v, _, simetrico in arcos:
+            graus[u + 1] += 1
+            if simetrico:
+                graus[v + 1] += 1
+        indptr = np.cumsum(graus)
+
+        # Segunda passada: cada arco ocupa a próxima posição livre da sua origem
+        m = int(indptr[-1])
+        indices = np.empty(m, dtype=np.int64)
+        weights = np.empty(m, dtype=np.float64)
+        proxima = indptr[:-1].tolist()
+        for u, v, peso, simetrico in arcos:
+            indices[proxima[u]] = v
+            weights[proxima[u]] = peso
+            proxima[u] += 1
+            if simetrico:
+                indices[proxima[v]] = u
+                weights[proxima[v]] = peso
+                proxima[v] += 1
+
+        return GrafoView(n, idx, indptr, indices, weights)
+
+    @functools.cached_property
+    def _pesos_inteiros(self) -> bool:
+        """
+        Se todos os pesos do grafo são `int`. Nesse caso o heap e os baldes somam
+        inteiros, e as distâncias do laço compilado (em float64) são convertidas.
+        """
+        return all(
+            isinstance(peso, int)
+            for vizinhanca in self._adj_indices
+            for _, peso in vizinhanca
+        )
+
+    @functools.cached_property
+    def _peso_maximo_inteiro(self) -> int | None:
+        """
+        O maior peso do grafo, se todos os pesos forem inteiros não negativos.
+
+        Retorna None caso algum peso seja fracionário ou negativo, situação em que
+        a fila de baldes (ver `_calcular_dijkstra_baldes`) não pode ser usada.
+        """
+        maior = 0
+        for vizinhanca in self._adj_indices:
+            for _, peso in vizinhanca:
+                if peso < 0 or not float(peso).is_integer():
+                    return None
+                if peso > maior:
+                    maior = peso
+        return int(maior)
+
+    @functools.cached_property
+    def _tamanho(self) -> int:
+        """O número de vértices mais o número de arcos de `_adj_indices` (V + E)."""
+        return len(self._adj_indices) + sum(map(len, self._adj_indices))
+
+    def _dijkstra(
+        self, origem: Vertice, /, estrategia: EstrategiaDijkstra = "auto"
+    ) -> tuple[dict[int, float], dict[int, int]]:
+        """
+        Retorna as distâncias e predecessores a partir de `origem`, com memoização.
+
+        Ambos os dicionários são indexados pelo índice dos vértices (ver `_vertices`).
+
+        O resultado de cada origem é calculado uma única vez por versão do grafo,
+        assim como `_adj` (ver `_validar_caches`). Como todas as
+        estratégias produzem distâncias mínimas, `estrategia` só vale para o cálculo
+        inicial de cada origem.
+        """
+        resultado = self._cache_dijkstra.get(origem)
+        if resultado is None:
+            peso_maximo = self._peso_maximo_inteiro
+            if estrategia == "bucket" and peso_maximo is None:
+                raise ValueError(
+                    "A estratégia 'bucket' exige pesos inteiros não negativos."
+                )
+
+            if estrategia == "bucket" or (
+                estrategia == "auto"
+                and peso_maximo is not None
+                and _get_dijkstra_numba() is None
+                and peso_maximo <= _FATOR_BALDES * self._tamanho
+            ):
+                resultado = self._calcular_dijkstra_baldes(origem, peso_maximo)
+            else:
+                resultado = self._calcular_dijkstra(origem)
+            self._cache_dijkstra[origem] = resultado
+        return resultado
+
+    def _calcular_dijkstra(
         self, origem: Vertice, /
+    ) -> tuple[dict[int, float], dict[int, int]]:
+        """
+        Executa o algoritmo de Dijkstra a partir de `origem`.
+
+        Trabalha apenas com os índices inteiros dos vértices (ver `_adj_indices`).
+        Em vez de guardar o caminho completo de cada vértice, registra apenas o
+        predecessor de cada um; os caminhos são reconstruídos sob demanda por
+        `_reconstruir_caminho`. Se `numba` estiver instalado, o laço principal roda
+        compilado (ver `_dijkstra_numba`) sobre a visão CSR do grafo (ver `_view`).
+
+        Args:
+            origem (Vertice): O vértice de origem (parâmetro posicional).
+
+        Returns:
+            tuple[dict[int, float], dict[int, int]]: As distâncias mínimas e o mapa
+            de predecessores, por índice. Vértices inalcançáveis podem não ter
+            distância: leia com `distancias.get(i, _INF)`.
+        """
+        indice_origem = self.grafo.vertices.indice_de(origem)
+
+        # Usar o laço compilado com Numba sobre a visão CSR, se disponível
+        if (dijkstra_numba := _get_dijkstra_numba()) is not None:
+            view = self._view
+            dist, pred = dijkstra_numba(
+                view.indptr, view.indices, view.weights, indice_origem, view.n
+            )
+            distancias_numba = dist.tolist()
+            # O laço compilado soma em float64; com pesos inteiros, o heap e os
+            # baldes devolvem inteiros, e as distâncias finitas voltam a sê-lo
+            if self._pesos_inteiros:
+                distancias_numba = [
+                    d if d == _INF else int(d) for d in distancias_numba
+                ]
+            return dict(enumerate(distancias_numba)), {
+                j: k for j, k in enumerate(pred.tolist()) if k >= 0
+            }
+
+        adj = self._adj_indices
+
+        # Inicialização: apenas os vértices alcançados recebem uma distância;
+        # os demais são lidos como `_INF` por `dict.get`
+        distancias: dict[int, float] = {indice_origem: 0}
+
+        # Predecessor de cada vértice no caminho mais curto a partir da origem
+        predecessores: dict[int, int] = {}
+
+        # Fila de prioridade (distância, vértice) com remoção preguiçosa.
+        # Os vértices são inteiros, então o empate na distância é resolvido pelo índice.
+        fila: list[tuple[float, int]] = [(0, indice_origem)]
+
+        while fila:
+            # Extrair o vértice com a menor distância atual
+            distancia_atual, atual = heapq.heappop(fila)
+
+            # Ignorar entradas obsoletas, já superadas por um caminho mais curto
+            if distancia_atual > distancias.get(atual, _INF):
+                continue
+
+            # Verificar todos os vizinhos do vértice atual
+            for vizinho, peso in adj[atual]:
+                # Calcular a nova distância
+                distancia_tentativa = distancia_atual + peso
+
+                # Se encontrarmos um caminho mais curto, atualizamos
+                if distancia_tentativa < distancias.get(vizinho, _INF):
+                    distancias[vizinho] = distancia_tentativa
+                    predecessores[vizinho] = atual
+                    heapq.heappush(fila, (distancia_tentativa, vizinho))
+
+        return distancias, predecessores
+
+    def _calcular_dijkstra_baldes(
+        self, origem: Vertice, peso_maximo: int, /
+    ) -> tuple[dict[int, float], dict[int, int]]:
+        """
+        Executa o algoritmo de Dijkstra com a fila de baldes de Dial.
+
+        Válido apenas para pesos inteiros não negativos. O balde `d % (C + 1)`, com
+        `C = peso_maximo`, guarda os vértices alcançados à distância `d`; como
+        nenhuma distância pendente passa de `d + C`, os `C + 1` baldes são
+        reaproveitados de forma circular. A extração do mínimo é só o avanço de `d`
+        até o próximo balde não vazio, sem as operações de `heapq`.
+
+        Args:
+            origem (Vertice): O vértice de origem (parâmetro posicional).
+            peso_maximo (int): O maior peso do grafo (ver `_peso_maximo_inteiro`).
+
+        Returns:
+            tuple[dict[int, float], dict[int, int]]: O mesmo formato de
+            `_calcular_dijkstra`.
+        """
+        indice_origem = self.grafo.vertices.indice_de(origem)
+        adj = self._adj_indices
+
+        distancias: dict[int, float] = {indice_origem: 0}
+        predecessores: dict[int, int] = {}
+
+        tamanho = peso_maximo + 1
+        baldes: list[list[int]] = [[] for _ in range(tamanho)]
+        baldes[0].append(indice_origem)
+        pendentes = 1
+        d = 0
+
+        while pendentes:
+            balde = baldes[d % tamanho]
+            # Arcos de peso zero devolvem vértices ao balde que está sendo esvaziado
+            while balde:
+                atual = balde.pop()
+                pendentes -= 1
+
+                # Ignorar entradas obsoletas, já superadas por um caminho mais curto
+                if distancias[atual] != d:
+                    continue
+
+                for vizinho, peso in adj[atual]:
+                    distancia_tentativa = distancias[atual] + peso
+                    if distancia_tentativa < distancias.get(vizinho, _INF):
+                        distancias[vizinho] = distancia_tentativa
+                        predecessores[vizinho] = atual
+                        baldes[int(distancia_tentativa) % tamanho].append(vizinho)
+                        pendentes += 1
+            d += 1
+
+        return distancias, predecessores
+
+    def _reconstruir_caminho(
+        self, predecessores: dict[int, int], origem: int, destino: int, /
+    ) -> list[Vertice]:
+        """
+        Reconstrói o caminho de `origem` até `destino` a partir dos predecessores.
+
+        Args:
+            predecessores (dict[int, int]): O mapa de predecessores de `_dijkstra`.
+            origem (int): O índice do vértice de origem.
+            destino (int): O índice do vértice de destino.
+
+        Returns:
+            list[Vertice]: Os vértices do caminho, ou uma lista vazia se `destino`
+            não for alcançável.
+        """
+        if destino != origem and destino not in predecessores:
+            return []
+
+        vertices = self._vertices
+        caminho = [vertices[destino]]
+        while destino != origem:
+            destino = predecessores[destino]
+            caminho.append(vertices[destino])
+        caminho.reverse()
+        return caminho
+
+    def calcular_caminho_minimo_dijkstra(
+        self, origem: Vertice, /, estrategia: EstrategiaDijkstra = "auto"
     ) -> dict[Vertice, tuple[float, list[Vertice]]]:
         """
         Implementa o algoritmo de Dijkstra para encontrar o caminho mais curto
@@ -486,6 +1230,12 @@ class CalculadoraDeGrafo:
 
         Args:
             origem (Vertice): O vértice de origem (parâmetro posicional).
+            estrategia (EstrategiaDijkstra): A fila de prioridade usada. "heap" usa
+                `heapq` (ou o laço compilado com `numba`, se disponível); "bucket"
+                usa a fila de baldes de Dial e exige pesos inteiros não negativos;
+                "auto" usa os baldes quando os pesos permitem, o maior peso é
+                pequeno diante do grafo (ver `_FATOR_BALDES`) e `numba` não está
+                instalado, e o heap nos demais casos.
 
         Returns:
             dict[Vertice, tuple[float, list[Vertice]]]: Um dicionário onde as chaves são os vértices
@@ -499,52 +1249,159 @@ class CalculadoraDeGrafo:
             >>> for vertice, (custo, caminho) in resultado.items():
             ...     print(f"De A para {vertice.id}: custo={custo}, caminho={[v.id for v in caminho]}")
         """
+        self._validar_caches()
+
         # Verificar se o vértice de origem existe no grafo
         if origem not in self.grafo.vertices:
             raise ValueError(f"O vértice de origem {origem.id} não existe no grafo.")
 
-        # Inicialização
-        distancias = {vertice: float("infinity") for vertice in self.grafo.vertices}
-        distancias[origem] = 0
+        distancias, predecessores = self._dijkstra(origem, estrategia)
+        indice_origem = self.grafo.vertices.indice_de(origem)
 
-        # Dicionário para armazenar o caminho mais curto para cada vértice
-        caminhos = {vertice: [] for vertice in self.grafo.vertices}
-        caminhos[origem] = [origem]
+        # Construir o resultado final
+        resultado: dict[Vertice, tuple[float, list[Vertice]]] = {}
+        for i, vertice in enumerate(self._vertices):
+            resultado[vertice] = (
+                distancias.get(i, _INF),
+                self._reconstruir_caminho(predecessores, indice_origem, i),
+            )
 
-        # Conjunto de vértices não visitados
-        vertices_nao_visitados = set(self.grafo.vertices.vertices)
+        return resultado
 
-        while vertices_nao_visitados:
-            # Encontrar o vértice não visitado com a menor distância atual
-            vertice_atual = min(vertices_nao_visitados, key=lambda v: distancias[v])
+    def calcular_caminhos_minimos_todos(
+        self, origens: Iterable[Vertice] | None = None, /
+    ) -> dict[Vertice, dict[Vertice, tuple[float, list[Vertice]]]]:
+        """
+        Calcula os caminhos mínimos a partir de várias origens de uma só vez.
 
-            # Se a distância é infinita, os vértices restantes são inacessíveis
-            if distancias[vertice_atual] == float("infinity"):
-                break
+        Se `scipy` estiver instalado, o grafo é convertido em uma matriz esparsa
+        CSR e todas as origens são resolvidas por `scipy.sparse.csgraph.dijkstra`,
+        implementado em C. Caso contrário, executa o Dijkstra em Python para cada
+        origem.
 
-            # Remover o vértice atual do conjunto de não visitados
-            vertices_nao_visitados.remove(vertice_atual)
+        Args:
+            origens (Iterable[Vertice] | None): As origens desejadas. Se None,
+                usa todos os vértices do grafo.
 
-            # Verificar todos os vizinhos do vértice atual
-            for vizinho in self.grafo.vertices:
-                # Verificar se há um arco entre o vértice atual e o vizinho
-                if (vertice_atual, vizinho) in self.grafo.arcos.arcos:
-                    arco = self.grafo.arcos.arcos[(vertice_atual, vizinho)]
+        Returns:
+            dict[Vertice, dict[Vertice, tuple[float, list[Vertice]]]]: Para cada
+            origem, o mesmo dicionário retornado por `calcular_caminho_minimo_dijkstra`.
 
-                    # Calcular a nova distância
-                    distancia_tentativa = distancias[vertice_atual] + arco.peso
+        Exemplo:
+            >>> calculadora = CalculadoraDeGrafo(grafo)
+            >>> todos = calculadora.calcular_caminhos_minimos_todos()
+            >>> custo, caminho = todos[Vertice("A")][Vertice("E")]
+        """
+        self._validar_caches()
+
+        origens = list(self.grafo.vertices if origens is None else origens)
+        for origem in origens:
+            if origem not in self.grafo.vertices:
+                raise ValueError(
+                    f"O vértice de origem {origem.id} não existe no grafo."
+                )
+
+        scipy_mod = _get_scipy()
+        if scipy_mod is None:
+            return {
+                origem: self.calcular_caminho_minimo_dijkstra(origem)
+                for origem in origens
+            }
+
+        csr_matrix, dijkstra = scipy_mod
+        view = self._view
+        vertices = self._vertices
+
+        matriz = csr_matrix(
+            (view.weights, view.indices, view.indptr), shape=(view.n, view.n)
+        )
+        distancias, predecessores = dijkstra(
+            matriz,
+            directed=True,
+            indices=[view.idx[origem] for origem in origens],
+            return_predecessors=True,
+        )
 
-                    # Se encontrarmos um caminho mais curto, atualizamos
-                    if distancia_tentativa < distancias[vizinho]:
-                        distancias[vizinho] = distancia_tentativa
-                        # Construir o novo caminho
-                        caminhos[vizinho] = caminhos[vertice_atual] + [vizinho]
+        # Traduzir as matrizes de volta para vértices apenas nas origens pedidas
+        resultado: dict[Vertice, dict[Vertice, tuple[float, list[Vertice]]]] = {}
+        pesos_inteiros = self._pesos_inteiros
+        for linha, origem in enumerate(origens):
+            dist_linha = distancias[linha].tolist()
+            # Assim como no Dijkstra de uma origem, pesos inteiros dão custos inteiros
+            if pesos_inteiros:
+                dist_linha = [d if d == _INF else int(d) for d in dist_linha]
+            pred_linha = predecessores[linha].tolist()
+            caminhos: dict[Vertice, tuple[float, list[Vertice]]] = {}
+            for j, vertice in enumerate(vertices):
+                if math.isinf(dist_linha[j]):
+                    caminhos[vertice] = (_INF, [])
+                    continue
+
+                caminho = [vertice]
+                k = pred_linha[j]
+                while k >= 0:
+                    caminho.append(vertices[k])
+                    k = pred_linha[k]
+                caminho.reverse()
+                caminhos[vertice] = (dist_linha[j], caminho)
+            resultado[origem] = caminhos
 
-        # Construir o resultado final
-        resultado = {}
-        for vertice in self.grafo.vertices:
-            resultado[vertice] = (distancias[vertice], caminhos[vertice])
+        return resultado
 
+    def encontrar_caminho_minimo_ids(
+        self, origem: Vertice, destino: Vertice, /
+    ) -> tuple[float, tuple[str, ...]]:
+        """
+        Encontra o caminho mais curto entre dois vértices, devolvendo apenas os ids.
+
+        O caminho é reconstruído direto dos predecessores registrados pelo Dijkstra,
+        convertendo cada índice no id do vértice durante a própria reconstrução.
+
+        Args:
+            origem (Vertice): O vértice de origem (parâmetro posicional).
+            destino (Vertice): O vértice de destino (parâmetro posicional).
+
+        Returns:
+            tuple[float, tuple[str, ...]]: O custo do caminho mínimo e os ids dos
+            vértices que o compõem, ou (inf, ()) se `destino` não for alcançável.
+            O resultado é memorizado por par (origem, destino).
+
+        Exemplo:
+            >>> calculadora = CalculadoraDeGrafo(grafo)
+            >>> calculadora.encontrar_caminho_minimo_ids(Vertice("A"), Vertice("E"))
+            (25, ('A', 'C', 'E'))
+        """
+        self._validar_caches()
+
+        # Verificar se os vértices existem no grafo
+        if origem not in self.grafo.vertices:
+            raise ValueError(f"O vértice de origem {origem.id} não existe no grafo.")
+        if destino not in self.grafo.vertices:
+            raise ValueError(f"O vértice de destino {destino.id} não existe no grafo.")
+
+        # Reaproveitar o caminho se o par já foi consultado
+        if (resultado := self._cache_caminhos.get((origem, destino))) is not None:
+            return resultado
+
+        # Calcular caminhos mínimos a partir da origem
+        distancias, predecessores = self._dijkstra(origem)
+        indice_origem = self.grafo.vertices.indice_de(origem)
+        atual = self.grafo.vertices.indice_de(destino)
+
+        # Verificar se o destino é alcançável
+        distancia = distancias.get(atual, _INF)
+        if math.isinf(distancia):
+            resultado = (_INF, ())
+        else:
+            vertices = self._vertices
+            ids = [vertices[atual].id]
+            while atual != indice_origem:
+                atual = predecessores[atual]
+                ids.append(vertices[atual].id)
+            ids.reverse()
+            resultado = (distancia, tuple(ids))
+
+        self._cache_caminhos[(origem, destino)] = resultado
         return resultado
 
     def encontrar_caminho_minimo(
@@ -553,6 +1410,8 @@ class CalculadoraDeGrafo:
         """
         Encontra o caminho mais curto entre dois vértices usando o algoritmo de Dijkstra.
 
+        Envolve `encontrar_caminho_minimo_ids`, convertendo os ids de volta em vértices.
+
         Args:
             origem (Vertice): O vértice de origem (parâmetro posicional).
             destino (Vertice): O vértice de destino (parâmetro posicional).
@@ -569,20 +1428,9 @@ class CalculadoraDeGrafo:
             >>> print(f"Custo mínimo: {custo}")
             >>> print(f"Caminho: {[v.id for v in caminho]}")
         """
-        # Verificar se os vértices existem no grafo
-        if origem not in self.grafo.vertices:
-            raise ValueError(f"O vértice de origem {origem.id} não existe no grafo.")
-        if destino not in self.grafo.vertices:
-            raise ValueError(f"O vértice de destino {destino.id} não existe no grafo.")
-
-        # Calcular caminhos mínimos a partir da origem
-        resultados = self.calcular_caminho_minimo_dijkstra(origem)
-
-        # Verificar se o destino é alcançável
-        if resultados[destino][0] == float("infinity"):
-            return float("infinity"), []
-
-        return resultados[destino]
+        custo, ids = self.encontrar_caminho_minimo_ids(origem, destino)
+        por_id = self._por_id
+        return custo, [por_id[i] for i in ids]
 
     def visualizar_caminho_minimo(self, origem: Vertice, destino: Vertice, /) -> None:
         """
@@ -609,7 +1457,7 @@ class CalculadoraDeGrafo:
 
             print(f"\n=== Caminho mínimo de {origem.id} para {destino.id} ===")
 
-            if custo == float("infinity"):
+            if math.isinf(custo):
                 print(f"Não existe caminho de {origem.id} para {destino.id}")
                 return
 
@@ -624,7 +1472,7 @@ class CalculadoraDeGrafo:
             for i in range(len(caminho) - 1):
                 v1 = caminho[i]
                 v2 = caminho[i + 1]
-                arco = self.grafo.arcos.arcos.get((v1, v2))
+                arco = self.grafo.arcos.obter(v1, v2)
                 if arco:
                     print(f"  {v1.id} -> {v2.id}: peso = {arco.peso}")
 
@@ -633,77 +1481,155 @@ class CalculadoraDeGrafo:
 
     def calcular_possibilidades_caminhos(
         self, v1: Vertice, v2: Vertice, /
-    ) -> Sequence[Sequence[Arco]]:
+    ) -> Iterator[Sequence[Arco]]:
         """
-        Calcula todos os caminhos possíveis entre dois vértices no grafo.
+        Gera todos os caminhos possíveis entre dois vértices no grafo.
 
-        Esta função implementa uma busca em profundidade (DFS) para encontrar todos os caminhos
-        possíveis entre o vértice de origem v1 e o vértice de destino v2. A função evita ciclos
-        não visitando o mesmo vértice mais de uma vez em um único caminho.
+        Esta função implementa uma busca em profundidade (DFS) iterativa, com uma pilha
+        explícita, para encontrar todos os caminhos possíveis entre o vértice de origem v1
+        e o vértice de destino v2. A função evita ciclos não visitando o mesmo vértice mais
+        de uma vez em um único caminho. Como não usa recursão, não está sujeita ao limite
+        de recursão do Python em caminhos longos.
 
         Args:
             v1 (Vertice): O vértice de origem (parâmetro posicional).
             v2 (Vertice): O vértice de destino (parâmetro posicional).
 
         Returns:
-            Sequence[Sequence[Arco]]: Uma sequência de sequências, onde cada sequência interna
-                                    representa um caminho possível como uma lista de arcos.
-                                    Retorna uma lista vazia se não houver caminhos entre v1 e v2.
+            Iterator[Sequence[Arco]]: Um iterador em que cada item representa um caminho
+                                    possível como uma lista de arcos. Os caminhos são
+                                    produzidos sob demanda, sem materializar todos de uma vez.
+                                    Não produz nada se não houver caminhos entre v1 e v2.
 
         Exemplo:
             >>> calculadora = CalculadoraDeGrafo(grafo)
             >>> v1 = Vertice("A")
             >>> v2 = Vertice("C")
-            >>> caminhos = calculadora.calcular_possibilidades_caminhos(v1, v2)
+            >>> caminhos = list(calculadora.calcular_possibilidades_caminhos(v1, v2))
             >>> len(caminhos)  # Número de caminhos possíveis
             2
         """
+        self._validar_caches()
 
-        # Lista para armazenar todos os caminhos encontrados
-        todos_caminhos: MutableSequence[Sequence[Arco]] = []
+        # Verificar se os vértices existem no grafo
+        if v1 not in self.grafo.vertices or v2 not in self.grafo.vertices:
+            return
+
+        # Origem e destino iguais: apenas o caminho vazio
+        if v1 == v2:
+            yield []
+            return
+
+        adj = self._adj
+        caminho_atual: list[Arco] = []
+        vertices_visitados: set[Vertice] = {v1}
+
+        # Pilha de (vértice, iterador sobre os seus vizinhos ainda não explorados)
+        pilha: list[tuple[Vertice, Iterator[tuple[Vertice, Arco]]]] = [
+            (v1, iter(adj[v1]))
+        ]
+
+        # Métodos ligados a nomes locais, fora do laço principal
+        visitar = vertices_visitados.add
+        desvisitar = vertices_visitados.remove
+        empilhar_arco = caminho_atual.append
+        desempilhar_arco = caminho_atual.pop
+        empilhar = pilha.append
+        desempilhar = pilha.pop
+
+        while pilha:
+            atual, vizinhos = pilha[-1]
+            proximo = next(vizinhos, None)
+
+            # Vizinhos esgotados: backtracking
+            if proximo is None:
+                desempilhar()
+                desvisitar(atual)
+                if caminho_atual:
+                    desempilhar_arco()
+                continue
+
+            vertice, arco = proximo
+            if vertice in vertices_visitados:
+                continue
+
+            # Se chegamos ao destino, produzimos uma cópia do caminho atual
+            if vertice == v2:
+                yield [*caminho_atual, arco]
+                continue
+
+            # Descer para o vizinho
+            visitar(vertice)
+            empilhar_arco(arco)
+            empilhar((vertice, iter(adj[vertice])))
+
+    def _dfs_pesos(
+        self, v1: Vertice, v2: Vertice, /, *, unitario: bool = False
+    ) -> Iterator[float]:
+        """
+        Gera a soma dos pesos de cada caminho possível entre dois vértices.
 
-        def dfs(
-            atual: Vertice,
-            destino: Vertice,
-            caminho_atual: MutableSequence[Arco],
-            vertices_visitados: MutableSet[Vertice],
-        ) -> None:
-            # Se chegamos ao destino, adicionamos o caminho atual aos resultados
-            if atual == destino:
-                todos_caminhos.append(caminho_atual)
-                return
+        Percorre os mesmos caminhos que `calcular_possibilidades_caminhos`, mas guarda
+        na pilha apenas a soma acumulada até cada vértice, sem montar as listas de
+        arcos.
 
-            # Marcar o vértice atual como visitado
-            vertices_visitados.add(atual)
+        Args:
+            v1 (Vertice): Ponto de partida (parâmetro posicional).
+            v2 (Vertice): Ponto de chegada (parâmetro posicional).
+            unitario (bool): Se True, conta cada arco como 1, gerando o comprimento
+                de cada caminho em vez do peso.
 
-            # Explorar todos os vértices adjacentes
-            for vertice in self.grafo.vertices:
-                # Verificar se há um arco entre o vértice atual e o vértice candidato
-                if (
-                    atual,
-                    vertice,
-                ) in self.grafo.arcos.arcos and vertice not in vertices_visitados:
-                    # Adicionar o arco ao caminho atual
-                    arco = self.grafo.arcos.arcos[(atual, vertice)]
-                    caminho_atual.append(arco)
+        Returns:
+            Iterator[float]: A soma (ou o comprimento) de cada caminho encontrado.
+        """
+        self._validar_caches()
 
-                    # Continuar a busca a partir deste novo vértice
-                    dfs(vertice, destino, caminho_atual, vertices_visitados)
+        # Verificar se os vértices existem no grafo
+        if v1 not in self.grafo.vertices or v2 not in self.grafo.vertices:
+            return
 
-                    # Backtracking: remover o último arco adicionado
-                    caminho_atual.pop()
+        inicial: float = 0 if unitario else 0.0
 
-            # Remover o vértice atual dos visitados para permitir explorar outros caminhos
-            vertices_visitados.remove(atual)
+        # Origem e destino iguais: apenas o caminho vazio
+        if v1 == v2:
+            yield inicial
+            return
 
-        # Verificar se os vértices existem no grafo
-        if v1 not in self.grafo.vertices or v2 not in self.grafo.vertices:
-            return todos_caminhos  # Retorna lista vazia se um dos vértices não existir
+        adj = self._adj
+        vertices_visitados: set[Vertice] = {v1}
+
+        # Pilha de (vértice, iterador sobre os vizinhos, soma acumulada até o vértice)
+        pilha: list[tuple[Vertice, Iterator[tuple[Vertice, Arco]], float]] = [
+            (v1, iter(adj[v1]), inicial)
+        ]
+
+        # Métodos ligados a nomes locais, fora do laço principal
+        visitar = vertices_visitados.add
+        desvisitar = vertices_visitados.remove
+        empilhar = pilha.append
+        desempilhar = pilha.pop
+
+        while pilha:
+            atual, vizinhos, soma = pilha[-1]
+            proximo = next(vizinhos, None)
+
+            # Vizinhos esgotados: backtracking
+            if proximo is None:
+                desempilhar()
+                desvisitar(atual)
+                continue
+
+            vertice, arco = proximo
+            if vertice in vertices_visitados:
+                continue
 
-        # Iniciar a busca em profundidade
-        dfs(v1, v2, [], set())
+            nova_soma = soma + (1 if unitario else arco.peso)
+            if vertice == v2:
+                yield nova_soma
+                continue
 
-        return todos_caminhos
+            visitar(vertice)
+            empilhar((vertice, iter(adj[vertice]), nova_soma))
 
     def calcular_soma_pesos(self, v1: Vertice, v2: Vertice, /) -> Sequence[float]:
         """Calcula a soma de todos os pesos possiveis entre dois vertices do grafo
@@ -715,14 +1641,7 @@ class CalculadoraDeGrafo:
         Returns:
             Sequence[int]: retorna uma Sequencia com todas as somas de cada peso possivel.
         """
-        possibilidades = self.calcular_possibilidades_caminhos(v1, v2)
-        pesos: MutableSequence[float] = []
-        for possibilidade in possibilidades:
-            soma_pesos: float = 0.0
-            for arco in possibilidade:
-                soma_pesos += arco.peso
-            pesos.append(soma_pesos)
-        return pesos
+        return list(self._dfs_pesos(v1, v2))
 
     def calcular_soma_comprimentos(self, v1: Vertice, v2: Vertice, /) -> Sequence[int]:
         """Calcula todos os comprimentos possiveis entre dois vertices do grafo
@@ -734,9 +1653,7 @@ class CalculadoraDeGrafo:
         Returns:
             Sequence[int]: retorna uma tupla com todos os comprimentos possiveis.
         """
-        possibilidades = self.calcular_possibilidades_caminhos(v1, v2)
-        comprimentos = [len(p) for p in possibilidades]
-        return comprimentos
+        return list(self._dfs_pesos(v1, v2, unitario=True))
 
 
 # endregion
@@ -759,14 +1676,7 @@ def main() -> None:
     vh = Vertice("H")
 
     # Adicionar vertices no grafo
-    grafo.vertices.criar(va)
-    grafo.vertices.criar(vb)
-    grafo.vertices.criar(vc)
-    grafo.vertices.criar(vd)
-    grafo.vertices.criar(ve)
-    grafo.vertices.criar(vf)
-    grafo.vertices.criar(vg)
-    grafo.vertices.criar(vh)
+    grafo.vertices.bulk_add((va, vb, vc, vd, ve, vf, vg, vh))
 
     # Associar vertices relacionados com pesos diferentes
     g(
@@ -800,7 +1710,7 @@ def main() -> None:
         caminho_str = (
             " -> ".join([v.id for v in caminho]) if caminho else "Não alcançável"
         )
-        custo_str = f"{custo}" if custo != float("infinity") else "Infinito"
+        custo_str = "Infinito" if math.isinf(custo) else f"{custo}"
         print(f"  Para {vertice.id}: custo = {custo_str}, caminho = {caminho_str}")
 
     # Visualizar um caminho específico
@@ -3,32 +3,167 @@ Implementação de uma estrutura de dados Grafo com funcionalidades de gerenciam
 arestas e cálculo de caminhos entre vértices.
 
 A implementação utiliza um dicionário para representar o grafo, onde as chaves são os vértices
-e os valores são conjuntos de tuplas (destino, peso) representando as arestas direcionadas.
+e os valores são listas de tuplas (destino, peso) representando as arestas direcionadas.
+Para as buscas, o grafo é convertido sob demanda em arrays CSR com ids inteiros (`GrafoCSR`).
 """
 
+import functools
+import importlib.util
+import math
+import os
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, NamedTuple
+
 # Define um tipo personalizado para representar o destino e o peso de uma aresta
 type DestinoEPeso = tuple[str, float]
 
+# Quantos caminhos `mostrar_caminhos_possiveis` acumula antes de cada escrita
+_CAMINHOS_POR_ESCRITA = 1024
+
+# Cabeçalhos de seção do arquivo de entrada e o estado de leitura de cada um
+_SECOES = {"VERTICES:": "vertices", "ARESTAS:": "arestas"}
+
+# Sequência ANSI que limpa a tela e move o cursor para o canto superior esquerdo
+_LIMPAR_TELA = "\x1b[2J\x1b[H"
+
+# Identificador da saída padrão e flag do modo de terminal virtual na API do Windows
+_STD_OUTPUT_HANDLE = -11
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+
+class GrafoCSR(NamedTuple):
+    """
+    Representação do grafo em formato CSR (compressed sparse row), com cada vértice
+    identificado por um inteiro de 0 a V - 1, na ordem de inserção.
+
+    Os destinos do vértice de id `i` são `indices[indptr[i]:indptr[i + 1]]`, com os
+    pesos correspondentes nas mesmas posições de `pesos`.
+
+    Atributos:
+        nomes (list[str]): Nome de cada vértice, indexado pelo id.
+        ids (dict[str, int]): Id de cada vértice, indexado pelo nome.
+        indptr (array): Início dos destinos de cada vértice ('q', tamanho V + 1).
+        indices (array): Id do destino de cada aresta ('q').
+        pesos (list[float]): Peso de cada aresta, como recebido em `add_aresta`.
+    """
+
+    nomes: list[str]
+    ids: dict[str, int]
+    indptr: array
+    indices: array
+    pesos: list[float]
+
+
+class CaminhosPlanos(NamedTuple):
+    """
+    Conjunto de caminhos guardado em arrays planos, sem um objeto por aresta.
+
+    O caminho `i` ocupa as posições `deslocamentos[i]:deslocamentos[i + 1]` de
+    `vertices` (ids dos vértices de cada passo) e de `pesos` (peso de cada passo).
+
+    Atributos:
+        nomes (list[str]): Nome de cada vértice, indexado pelo id.
+        vertices (array): Ids dos vértices de todos os caminhos, concatenados ('q').
+        pesos (array): Pesos das arestas de todos os caminhos, concatenados ('d').
+        deslocamentos (array): Início de cada caminho, mais o total no fim ('q').
+    """
+
+    nomes: list[str]
+    vertices: array
+    pesos: array
+    deslocamentos: array
+
+    def iterar(self) -> Iterator[list[DestinoEPeso]]:
+        """
+        Gera cada caminho como uma lista de tuplas (vértice, peso), convertendo os
+        ids em nomes apenas neste momento.
+        """
+        nomes, vertices, pesos, deslocamentos = self
+        for i in range(len(deslocamentos) - 1):
+            inicio, fim = deslocamentos[i], deslocamentos[i + 1]
+            yield [
+                (nomes[v], pesos[j]) for j, v in enumerate(vertices[inicio:fim], inicio)
+            ]
+
+
+@functools.lru_cache(maxsize=1)
+def _habilitar_ansi() -> None:
+    """
+    Habilita as sequências ANSI no console do Windows, uma única vez.
+
+    O console do Windows 10+ só interpreta as sequências depois que o modo de
+    terminal virtual é ativado na saída padrão, o que é feito diretamente com
+    `SetConsoleMode`, sem criar um processo. Nos demais sistemas não há nada a fazer.
+    """
+    if os.name != "nt":
+        return
+
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    saida = kernel32.GetStdHandle(_STD_OUTPUT_HANDLE)
+    modo = ctypes.c_ulong()
+    # Falha quando a saída não é um console (por exemplo, redirecionada)
+    if kernel32.GetConsoleMode(saida, ctypes.byref(modo)):
+        kernel32.SetConsoleMode(saida, modo.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+
+
+def _limpar_tela() -> None:
+    """Limpa a tela do terminal escrevendo `_LIMPAR_TELA`, sem criar um processo."""
+    _habilitar_ansi()
+    sys.stdout.write(_LIMPAR_TELA)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_caminhos_numba() -> Callable[..., Any] | None:
+    """
+    Importa a enumeração de caminhos compilada com Numba (`_caminhos_numba`) sob demanda.
+
+    Returns:
+        Callable | None: A função `_caminhos_numba.enumerar_caminhos`, ou None se o
+        pacote `numba` não estiver instalado ou o módulo não puder ser importado
+        (por exemplo, sem o diretório deste arquivo no `sys.path`).
+    """
+    if importlib.util.find_spec("numba") is None:
+        return None
+
+    try:
+        from _caminhos_numba import enumerar_caminhos
+    except ImportError:
+        return None
+
+    return enumerar_caminhos
+
 
 class Grafo:
     """
     Classe que implementa um grafo direcionado com pesos nas arestas.
 
     Atributos:
-        grafo (dict[str, set[DestinoEPeso]]): Dicionário que mapeia vértices para seus destinos e pesos.
+        grafo (dict[str, list[DestinoEPeso]]): Dicionário que mapeia vértices para seus destinos e pesos.
     """
 
-    grafo: dict[str, set[DestinoEPeso]]
+    grafo: dict[str, list[DestinoEPeso]]
+    _csr: GrafoCSR | None
+    _cache_topologica: dict[int, list[int] | None]
+    _cache_sufixos: dict[tuple[int, int], int]
+    _cache_contagens: dict[tuple[int, int], tuple[int, float]]
 
-    def __init__(self, grafo: dict[str, set[DestinoEPeso]] | None = None) -> None:
+    def __init__(self, grafo: dict[str, list[DestinoEPeso]] | None = None) -> None:
         """
         Inicializa um novo grafo, opcionalmente a partir de um dicionário existente.
 
         Args:
-            grafo (dict[str, set[DestinoEPeso]] | None, opcional): Dicionário inicial para o grafo.
-                                                                  Se None, cria um grafo vazio.
+            grafo (dict[str, list[DestinoEPeso]] | None, opcional): Dicionário inicial para o grafo.
+                                                                   Se None, cria um grafo vazio.
         """
-        self.grafo = grafo or {}
+        self.grafo = {} if grafo is None else grafo
+        self._csr = None
+        self._cache_topologica = {}
+        self._cache_sufixos = {}
+        self._cache_contagens = {}
 
     def add_vertice(self, vertice: str) -> None:
         """
@@ -37,15 +172,16 @@ class Grafo:
         Args:
             vertice (str): Nome do vértice a ser adicionado.
         """
-        vertice_ja_criado = vertice in self.grafo.keys()
-        if vertice_ja_criado:
-            return
-
-        self.grafo[vertice.upper()] = set([])
+        # `setdefault` verifica e insere com uma única busca no dicionário
+        total = len(self.grafo)
+        self.grafo.setdefault(vertice.upper(), [])
+        if len(self.grafo) != total:
+            self._csr = None
 
     def add_aresta(self, origem: str, destino: str, peso: float) -> None:
         """
         Adiciona uma aresta direcionada com peso entre dois vértices.
+        Uma aresta idêntica (mesmo destino e peso) já existente não é duplicada.
 
         Args:
             origem (str): Vértice de origem da aresta.
@@ -55,15 +191,212 @@ class Grafo:
         Raises:
             RuntimeError: Se qualquer um dos vértices não existir no grafo.
         """
-        origem_nao_criada = origem.upper() not in self.grafo.keys()
-        if origem_nao_criada:
+        origem = origem.upper()
+        destino = destino.upper()
+
+        if origem not in self.grafo:
             raise RuntimeError("O primeiro vertice não foi encontrado no grafo.")
 
-        destino_nao_criado = destino.upper() not in self.grafo.keys()
-        if destino_nao_criado:
+        if destino not in self.grafo:
             raise RuntimeError("O segundo vertice não foi encontrado no grafo.")
 
-        self.grafo[origem.upper()].add((destino.upper(), peso))
+        destinos = self.grafo[origem]
+        aresta = (destino, peso)
+        # Os graus são pequenos, então a busca linear é mais barata que um conjunto
+        if aresta not in destinos:
+            destinos.append(aresta)
+            self._csr = None
+
+    def obter_csr(self) -> GrafoCSR:
+        """
+        Retorna a representação CSR do grafo, construindo-a no primeiro uso.
+
+        A representação é descartada por `add_vertice` e `add_aresta`; quem alterar
+        `grafo` diretamente deve atribuir None a `_csr` em seguida. Os caches que
+        dependem dos ids (ordens topológicas e contagens de caminhos) são
+        esvaziados sempre que ela é reconstruída.
+
+        Returns:
+            GrafoCSR: Os ids dos vértices e os arrays CSR das arestas.
+        """
+        if self._csr is not None:
+            return self._csr
+
+        nomes = list(self.grafo)
+        ids = {nome: i for i, nome in enumerate(nomes)}
+        indptr = array("q", [0])
+        indices = array("q")
+        pesos: list[float] = []
+        for nome in nomes:
+            for destino, peso in self.grafo[nome]:
+                indices.append(ids[destino])
+                pesos.append(peso)
+            indptr.append(len(indices))
+
+        self._csr = GrafoCSR(nomes, ids, indptr, indices, pesos)
+        self._cache_topologica = {}
+        self._cache_sufixos = {}
+        self._cache_contagens = {}
+        return self._csr
+
+    def _ordem_topologica(self, id_origem: int) -> list[int] | None:
+        """
+        Ordena topologicamente os vértices alcançáveis a partir de `id_origem`.
+
+        Args:
+            id_origem (int): Id do vértice de origem.
+
+        Returns:
+            list[int] | None: Os ids alcançáveis em ordem topológica, ou None se houver
+            um ciclo alcançável a partir da origem. O resultado fica em cache até a
+            representação CSR ser reconstruída.
+        """
+        if id_origem in self._cache_topologica:
+            return self._cache_topologica[id_origem]
+
+        _, _, indptr, indices, _ = self.obter_csr()
+
+        # 0: não visitado, 1: na pilha da busca, 2: concluído
+        estado = bytearray(len(indptr) - 1)
+        estado[id_origem] = 1
+        pos_ordem: list[int] = []
+        pilha = [(id_origem, iter(range(indptr[id_origem], indptr[id_origem + 1])))]
+
+        ordem: list[int] | None = None
+        while pilha:
+            u, arestas = pilha[-1]
+            k = next(arestas, None)
+            if k is None:
+                pilha.pop()
+                estado[u] = 2
+                pos_ordem.append(u)
+                continue
+
+            v = indices[k]
+            # Aresta para um vértice ainda na pilha: há um ciclo
+            if estado[v] == 1:
+                break
+            if estado[v] == 0:
+                estado[v] = 1
+                pilha.append((v, iter(range(indptr[v], indptr[v + 1]))))
+        else:
+            pos_ordem.reverse()
+            ordem = pos_ordem
+
+        self._cache_topologica[id_origem] = ordem
+        return ordem
+
+    def _contar_sufixos(self, ordem: list[int], id_destino: int) -> None:
+        """
+        Preenche `_cache_sufixos` com o número de caminhos de cada vértice de `ordem`
+        até `id_destino`, por programação dinâmica.
+
+        Como `ordem` é topológica e acíclica, o número de caminhos de `u` é a soma do
+        número de caminhos dos destinos das suas arestas, já calculados por virem
+        depois na ordem. Guardar só as contagens mantém o cache em O(V), qualquer que
+        seja o número de caminhos.
+
+        Args:
+            ordem (list[int]): Vértices em ordem topológica (ver `_ordem_topologica`).
+            id_destino (int): Id do vértice de destino.
+        """
+        _, _, indptr, indices, _ = self.obter_csr()
+        cache = self._cache_sufixos
+
+        for u in reversed(ordem):
+            if (u, id_destino) in cache:
+                continue
+            if u == id_destino:
+                cache[(u, id_destino)] = 1
+                continue
+            cache[(u, id_destino)] = sum(
+                cache[(indices[k], id_destino)] for k in range(indptr[u], indptr[u + 1])
+            )
+
+    def _contar_e_somar(self, origem: str, destino: str) -> tuple[int, float]:
+        """
+        Conta os caminhos simples de `origem` até `destino` e soma os pesos de todos
+        eles, sem enumerá-los quando possível.
+
+        Se a parte do grafo alcançável a partir da origem for acíclica, usa
+        programação dinâmica na ordem topológica inversa, em O(V + E):
+        `contagem[u]` é a soma de `contagem[v]` e `soma[u]` a soma de
+        `peso * contagem[v] + soma[v]` sobre as arestas `u -> v`. Com ciclos, recorre
+        à enumeração de `_caminhos_em_arestas`. O resultado fica em cache até a
+        representação CSR ser reconstruída.
+
+        Args:
+            origem (str): Vértice de origem.
+            destino (str): Vértice de destino.
+
+        Returns:
+            tuple[int, float]: O número de caminhos e a soma dos pesos de todos eles.
+        """
+        _, ids, indptr, indices, pesos = self.obter_csr()
+        id_origem = ids[origem]
+        id_destino = ids.get(destino, -1)
+
+        chave = (id_origem, id_destino)
+        if chave in self._cache_contagens:
+            return self._cache_contagens[chave]
+
+        if id_origem == id_destino:
+            resultado = (1, 0.0)
+        elif id_destino < 0:
+            resultado = (0, 0.0)
+        elif (ordem := self._ordem_topologica(id_origem)) is not None:
+            contagem: dict[int, int] = {}
+            soma: dict[int, float] = {}
+            for u in reversed(ordem):
+                if u == id_destino:
+                    contagem[u] = 1
+                    soma[u] = 0.0
+                    continue
+                contagem[u] = sum(
+                    contagem[indices[k]] for k in range(indptr[u], indptr[u + 1])
+                )
+                soma[u] = math.fsum(
+                    pesos[k] * contagem[indices[k]] + soma[indices[k]]
+                    for k in range(indptr[u], indptr[u + 1])
+                )
+            resultado = (contagem[id_origem], soma[id_origem])
+        else:
+            total = 0
+            parcelas: list[float] = []
+            for arestas in self._caminhos_em_arestas(origem, destino, set()):
+                total += 1
+                parcelas.extend([pesos[k] for k in arestas])
+            resultado = (total, math.fsum(parcelas))
+
+        self._cache_contagens[chave] = resultado
+        return resultado
+
+    def contar_caminhos(self, origem: str, destino: str) -> int:
+        """
+        Conta os caminhos possíveis entre dois vértices (ver `_contar_e_somar`).
+
+        Args:
+            origem (str): Vértice de origem.
+            destino (str): Vértice de destino.
+
+        Returns:
+            int: Número de caminhos simples entre origem e destino; 1 se forem iguais.
+        """
+        return self._contar_e_somar(origem, destino)[0]
+
+    def somar_pesos_caminhos(self, origem: str, destino: str) -> float:
+        """
+        Soma os pesos de todos os caminhos possíveis entre dois vértices (ver
+        `_contar_e_somar`).
+
+        Args:
+            origem (str): Vértice de origem.
+            destino (str): Vértice de destino.
+
+        Returns:
+            float: Soma dos pesos de todas as arestas de todos os caminhos.
+        """
+        return self._contar_e_somar(origem, destino)[1]
 
     def obter_peso_vertices_adjacentes(self, origem: str, destino: str) -> float:
         """
@@ -79,15 +412,16 @@ class Grafo:
         Raises:
             RuntimeError: Se a origem não existir ou os vértices não forem adjacentes.
         """
-        if origem not in self.grafo.keys():
-            raise RuntimeError("A origem não foi cadastrada.")
+        origem = origem.upper()
+        destino = destino.upper()
 
-        destinos = self.grafo[origem]
-        peso: float | None = None
-        for _dest, _peso in destinos:
-            if destino == _dest:
-                peso = _peso
+        if origem not in self.grafo:
+            raise RuntimeError("A origem não foi cadastrada.")
 
+        # Parar na primeira aresta para o destino
+        peso = next(
+            (_peso for _dest, _peso in self.grafo[origem] if _dest == destino), None
+        )
         if peso is None:
             raise RuntimeError("Os vertices não são adjacentes.")
 
@@ -96,16 +430,18 @@ class Grafo:
     def visualizar(self) -> None:
         """
         Exibe uma representação visual do grafo no terminal.
-        Limpa a tela antes de exibir o grafo.
+        Limpa a tela antes de exibir o grafo. O texto é montado por inteiro e escrito
+        de uma só vez.
         """
-        import os
-
-        os.system("cls" if os.name == "nt" else "clear")
-        for origem, destinos in self.grafo.items():
-            print(f"{origem}: ", end=" ")
-            for _destino, _peso in destinos:
-                print(f"{_destino}({_peso}),", end="   ")
-            print()
+        _limpar_tela()
+        sys.stdout.write(
+            "".join(
+                f"{origem}:  "
+                + "".join(f"{_destino}({_peso}),   " for _destino, _peso in destinos)
+                + "\n"
+                for origem, destinos in self.grafo.items()
+            )
+        )
 
     def calcular_caminhos_possiveis(
         self,
@@ -113,74 +449,218 @@ class Grafo:
         destino: str,
         caminho_atual: list[DestinoEPeso] | None = None,
         visitados: set[str] | None = None,
-    ) -> list[list[DestinoEPeso]]:
+    ) -> Iterator[list[DestinoEPeso]]:
         """
-        Calcula todos os caminhos possíveis entre dois vértices usando busca em profundidade.
-        É uma função recursiva.
+        Gera todos os caminhos possíveis entre dois vértices usando busca em profundidade.
+        Os caminhos são produzidos à medida que são encontrados, sem materializar a
+        lista completa, que pode crescer exponencialmente. A busca em si é feita por
+        `_caminhos_em_arestas`; aqui as arestas são apenas convertidas em nomes.
 
         Args:
             origem (str): Vértice de origem.
             destino (str): Vértice de destino.
             caminho_atual (list[DestinoEPeso] | None, opcional): Lista de vértices e pesos
-                                                                      no caminho atual. Padrão é None.
+                                                                      que antecedem a origem. Padrão é None.
             visitados (set[str] | None, opcional): Conjunto de vértices já visitados. Padrão é None.
 
         Returns:
-            list[list[DestinoEPeso]]: Lista de todos os caminhos possíveis entre origem e destino.
-                                     Cada caminho é uma lista de tuplas (vértice, peso).
+            Iterator[list[DestinoEPeso]]: Iterador sobre os caminhos possíveis entre origem e
+                                          destino. Cada caminho é uma lista nova de tuplas
+                                          (vértice, peso).
         """
         # Inicializar valores padrão
-        caminho_atual = caminho_atual or []
-        visitados = visitados or set()
+        if caminho_atual is None:
+            caminho_atual = []
+        if visitados is None:
+            visitados = set()
+
+        # Se a origem já é o destino, o caminho atual é o único caminho
+        if origem == destino:
+            yield caminho_atual[:]
+            return
+
+        nomes, _, _, indices, pesos = self.obter_csr()
+        for arestas in self._caminhos_em_arestas(origem, destino, visitados):
+            yield [*caminho_atual, *[(nomes[indices[k]], pesos[k]) for k in arestas]]
+
+    def calcular_caminhos_planos(self, origem: str, destino: str) -> CaminhosPlanos:
+        """
+        Calcula todos os caminhos possíveis entre dois vértices, guardando-os em arrays
+        planos (ver `CaminhosPlanos`) em vez de uma lista de listas de tuplas.
 
-        # Registrar o vértice atual como visitado
-        visitados.add(origem)
+        Como todos os caminhos são materializados de qualquer forma, se `numba` estiver
+        instalado a busca é feita de uma só vez pelo núcleo compilado (ver
+        `_caminhos_numba`); sem ele, os caminhos vêm de `_caminhos_em_arestas`.
+
+        Args:
+            origem (str): Vértice de origem.
+            destino (str): Vértice de destino.
+
+        Returns:
+            CaminhosPlanos: Os ids e pesos de todos os caminhos, com os deslocamentos de
+            cada um. Se origem e destino forem iguais, contém apenas o caminho vazio.
+        """
+        nomes, ids, indptr, indices, pesos = self.obter_csr()
+        vertices_planos = array("q")
+        pesos_planos = array("d")
+        deslocamentos = array("q", [0])
 
-        # Se chegamos ao destino, retornamos o caminho atual como um único caminho em uma lista
         if origem == destino:
-            return [caminho_atual]
+            deslocamentos.append(0)
+        elif (enumerar_caminhos := _get_caminhos_numba()) is not None:
+            import numpy as np
+
+            indices_np = np.frombuffer(indices, dtype=np.int64)
+            arestas, limites = enumerar_caminhos(
+                np.frombuffer(indptr, dtype=np.int64),
+                indices_np,
+                ids[origem],
+                ids.get(destino, -1),
+                np.zeros(len(nomes), dtype=np.uint8),
+            )
+            vertices_planos.frombytes(indices_np[arestas].tobytes())
+            pesos_planos.frombytes(
+                np.asarray(pesos, dtype=np.float64)[arestas].tobytes()
+            )
+            deslocamentos = array("q", limites.tobytes())
+        else:
+            for arestas in self._caminhos_em_arestas(origem, destino, set()):
+                vertices_planos.extend([indices[k] for k in arestas])
+                pesos_planos.extend([pesos[k] for k in arestas])
+                deslocamentos.append(len(vertices_planos))
+
+        return CaminhosPlanos(nomes, vertices_planos, pesos_planos, deslocamentos)
+
+    def _caminhos_em_arestas(
+        self, origem: str, destino: str, visitados: set[str]
+    ) -> Iterator[Sequence[int]]:
+        """
+        Gera os caminhos simples de `origem` até `destino` (diferentes entre si) como
+        sequências de posições CSR de arestas (ver `obter_csr`).
+
+        A busca é iterativa, com uma pilha explícita, e por isso não está sujeita ao
+        limite de recursão do Python em grafos profundos; ela compara apenas ids
+        inteiros. Cada caminho é produzido assim que é encontrado; a busca compilada
+        com Numba, que só retorna ao final, fica para `calcular_caminhos_planos`.
+
+        Quando nenhum vértice além da origem é dado em `visitados`, o número de
+        caminhos de cada vértice até o destino é memorizado (ver `_contar_sufixos`)
+        sempre que a parte do grafo alcançável a partir dele é acíclica: a busca não
+        desce pelos vértices que não levam ao destino, de modo que, se toda a parte
+        alcançável a partir da origem for acíclica, cada descida produz ao menos um
+        caminho. Os caminhos continuam sendo gerados um a um.
+
+        Args:
+            origem (str): Vértice de origem.
+            destino (str): Vértice de destino.
+            visitados (set[str]): Vértices que os caminhos não podem usar.
 
-        # Lista para armazenar todos os caminhos encontrados
-        caminhos: list[list[DestinoEPeso]] = []
+        Returns:
+            Iterator[Sequence[int]]: As posições das arestas de cada caminho.
+        """
+        nomes, ids, indptr, indices, _ = self.obter_csr()
+        id_origem = ids[origem]
+        id_destino = ids.get(destino, -1)
+
+        # As contagens memorizadas só valem se nenhum vértice foi bloqueado pelo chamador
+        memorizar = visitados <= {origem}
+        sufixos = self._cache_sufixos if memorizar else {}
+        if memorizar and id_destino >= 0:
+            ordem = self._ordem_topologica(id_origem)
+            if ordem is not None:
+                self._contar_sufixos(ordem, id_destino)
+
+        # Vértices visitados: um byte por id, 1 se o vértice está no caminho
+        marcados = bytearray(len(nomes))
+        for v in visitados:
+            if v in ids:
+                marcados[ids[v]] = 1
+
+        marcados[id_origem] = 1
+
+        # Arestas usadas para chegar a cada vértice do caminho atual
+        caminho: list[int] = []
+
+        # Pilha de (vértice, iterador sobre as posições CSR das suas arestas)
+        pilha = [(id_origem, iter(range(indptr[id_origem], indptr[id_origem + 1])))]
+
+        # Métodos usados a cada aresta, resolvidos uma única vez
+        empilhar = pilha.append
+        desempilhar = pilha.pop
+        avancar = caminho.append
+        recuar = caminho.pop
+        contar_sufixos = sufixos.get
+
+        while pilha:
+            u, arestas = pilha[-1]
+            k = next(arestas, None)
+
+            # Arestas esgotadas: retroceder
+            if k is None:
+                desempilhar()
+                marcados[u] = 0
+                if pilha:
+                    recuar()
+                continue
+
+            v = indices[k]
 
-        # Explorar todos os vértices adjacentes
-        for proximo_destino, peso in self.grafo[origem]:
             # Verificar se o vértice já foi visitado para evitar ciclos
-            if proximo_destino in visitados:
+            if marcados[v]:
                 continue
 
-            # Chamada recursiva para continuar a partir do próximo destino
-            caminhos_encontrados = self.calcular_caminhos_possiveis(
-                origem=proximo_destino.upper(),
-                destino=destino.upper(),
-                caminho_atual=caminho_atual + [(proximo_destino, peso)],
-                visitados=visitados.copy(),
-            )
+            # Se chegamos ao destino, produzimos uma cópia do caminho e não descemos
+            if v == id_destino:
+                yield (*caminho, k)
+                continue
 
-            # Adicionar os caminhos encontrados à lista de caminhos
-            caminhos.extend(caminhos_encontrados)
+            # Não descer por vértices que sabidamente não levam ao destino
+            if contar_sufixos((v, id_destino)) == 0:
+                continue
 
-        return caminhos
+            # Descer para o próximo destino
+            avancar(k)
+            marcados[v] = 1
+            empilhar((v, iter(range(indptr[v], indptr[v + 1]))))
 
-    def mostrar_caminhos_possiveis(self, caminhos: list[list[DestinoEPeso]]) -> None:
+    def mostrar_caminhos_possiveis(
+        self, caminhos: Iterable[list[DestinoEPeso]] | CaminhosPlanos
+    ) -> None:
         """
         Exibe todos os caminhos possíveis entre dois vértices, com seus respectivos pesos.
+        O texto é montado em blocos de `_CAMINHOS_POR_ESCRITA` caminhos, cada um escrito
+        de uma só vez, para que um iterador de caminhos seja exibido sem ser
+        materializado.
 
         Args:
-            caminhos (list[list[DestinoEPeso]]): Lista de caminhos a serem exibidos.
-                                                Cada caminho é uma lista de tuplas (vértice, peso).
+            caminhos (Iterable[list[DestinoEPeso]] | CaminhosPlanos): Caminhos a serem exibidos,
+                por exemplo o iterador de `calcular_caminhos_possiveis`, em que cada caminho é
+                uma lista de tuplas (vértice, peso), ou o resultado de `calcular_caminhos_planos`,
+                cujos ids só são convertidos em nomes durante a exibição.
         """
-        import os
+        if isinstance(caminhos, CaminhosPlanos):
+            caminhos = caminhos.iterar()
 
-        os.system("cls" if os.name == "nt" else "clear")
+        _limpar_tela()
 
+        partes: list[str] = []
         for i, caminho in enumerate(caminhos, 1):
-            print(f"Caminho {i}:", end=" ")
-            peso_total = 0
-            for destino, peso in caminho:
-                print(f"{destino} ({peso}) →", end=" ")
-                peso_total += peso
-            print(f"Peso total: {peso_total}")
+            # Soma exata dos pesos, calculada fora da formatação; pesos inteiros
+            # continuam somando um inteiro
+            pesos = [peso for _, peso in caminho]
+            if all(isinstance(peso, int) for peso in pesos):
+                peso_total = sum(pesos)
+            else:
+                peso_total = math.fsum(pesos)
+            partes.append(f"Caminho {i}: ")
+            partes.extend(f"{destino} ({peso}) → " for destino, peso in caminho)
+            partes.append(f"Peso total: {peso_total}\n")
+
+            if i % _CAMINHOS_POR_ESCRITA == 0:
+                sys.stdout.write("".join(partes))
+                partes.clear()
+
+        sys.stdout.write("".join(partes))
 
 
 def ler_grafo_de_arquivo(nome_arquivo: str) -> Grafo:
@@ -209,48 +689,60 @@ def ler_grafo_de_arquivo(nome_arquivo: str) -> Grafo:
         ValueError: Se o formato do arquivo for inválido.
     """
     g = Grafo()
-
-    with open(nome_arquivo, "r") as arquivo:
-        linhas = arquivo.readlines()
+    adjacencias = g.grafo
 
     # Estado para controlar o que estamos lendo
     estado = None
 
-    for numero_linha, linha in enumerate(linhas, 1):
-        linha = linha.strip()
-
-        # Ignorar linhas em branco ou comentários
-        if not linha or linha.startswith("#"):
-            continue
-
-        # Verificar seções
-        if linha == "VERTICES:":
-            estado = "vertices"
-            continue
-        elif linha == "ARESTAS:":
-            estado = "arestas"
-            continue
-
-        # Processar conteúdo baseado no estado atual
-        if estado == "vertices":
-            g.add_vertice(linha)
-        elif estado == "arestas":
-            partes = linha.split()
-            if len(partes) != 3:
-                raise ValueError(
-                    f"Formato inválido na linha {numero_linha}: '{linha}'. Use 'origem destino peso'"
-                )
+    # Ler linha a linha, sem carregar o arquivo inteiro em memória
+    with open(nome_arquivo, "r") as arquivo:
+        for numero_linha, linha in enumerate(arquivo, 1):
+            linha = linha.strip()
 
-            origem, destino, peso_str = partes
-            try:
-                peso = float(peso_str)
-                g.add_aresta(origem=origem, destino=destino, peso=peso)
-            except ValueError:
-                raise ValueError(f"Peso inválido na linha {numero_linha}: '{peso_str}'")
-            except RuntimeError as e:
-                raise ValueError(
-                    f"Erro ao adicionar aresta na linha {numero_linha}: {e}"
-                )
+            # Ignorar linhas em branco ou comentários
+            if not linha or linha.startswith("#"):
+                continue
+
+            # Verificar seções
+            if (secao := _SECOES.get(linha)) is not None:
+                estado = secao
+                continue
+
+            # Processar conteúdo baseado no estado atual
+            if estado == "vertices":
+                adjacencias.setdefault(linha.upper(), [])
+            elif estado == "arestas":
+                partes = linha.split()
+                if len(partes) != 3:
+                    raise ValueError(
+                        f"Formato inválido na linha {numero_linha}: '{linha}'. Use 'origem destino peso'"
+                    )
+
+                origem, destino, peso_str = partes
+                try:
+                    peso = float(peso_str)
+                except ValueError:
+                    raise ValueError(
+                        f"Peso inválido na linha {numero_linha}: '{peso_str}'"
+                    )
+
+                # Inserir direto na lista de adjacência, com uma única verificação
+                # de existência, em vez de passar por `add_aresta`
+                origem = origem.upper()
+                destino = destino.upper()
+                if origem not in adjacencias or destino not in adjacencias:
+                    vertice = "primeiro" if origem not in adjacencias else "segundo"
+                    raise ValueError(
+                        f"Erro ao adicionar aresta na linha {numero_linha}: "
+                        f"O {vertice} vertice não foi encontrado no grafo."
+                    )
+
+                destinos = adjacencias[origem]
+                if (destino, peso) not in destinos:
+                    destinos.append((destino, peso))
+
+    # As arestas foram inseridas sem passar por `add_aresta`
+    g._csr = None
 
     # Verificar se o grafo tem pelo menos um vértice
     if not g.grafo:
@@ -301,16 +793,11 @@ D E 2.5""")
         origem = input("\nDigite o vértice de origem: ").upper()
         destino = input("Digite o vértice de destino: ").upper()
 
-        caminhos = g.calcular_caminhos_possiveis(
-            origem=origem.upper(), destino=destino.upper()
-        )
+        caminhos = list(g.calcular_caminhos_possiveis(origem=origem, destino=destino))
 
         print(caminhos)
 
-        soma = 0
-        for caminho in caminhos:
-            for _, peso in caminho:
-                soma += peso
+        soma = sum(peso for caminho in caminhos for _, peso in caminho)
 
         print(soma)
 
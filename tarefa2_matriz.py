@@ -2,7 +2,8 @@
 Módulo para manipulação de grafos ponderados direcionados usando matriz de adjacência.
 
 Este módulo implementa uma estrutura de dados para representar grafos direcionados
-com pesos nas arestas, utilizando um dicionário de dicionários como matriz de adjacência.
+com pesos nas arestas, utilizando uma matriz de adjacência esparsa em formato CSR
+(`GrafoCSR`), com ids inteiros para os vértices.
 Também inclui funções para calcular e visualizar todos os caminhos possíveis entre dois vértices.
 
 Tipos:
@@ -10,25 +11,168 @@ Tipos:
     CaminhoPossivel: Lista de tuplas DestinoEPeso representando um caminho completo no grafo.
 """
 
+import bisect
+import functools
+import importlib.util
+import math
+import sys
+import threading
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence, Sized
+from types import MappingProxyType, ModuleType
+from typing import NamedTuple
+
 type DestinoEPeso = tuple[str, float]
 type CaminhoPossivel = list[DestinoEPeso]
 type RepresentacaoGrafo = dict[str, dict[str, float | None]]
+type MatrizSomenteLeitura = Mapping[str, Mapping[str, float | None]]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_caminhos_ext() -> Callable[..., tuple[array, array]] | None:
+    """
+    Importa a enumeração de caminhos da extensão Cython `_grafo_ext` sob demanda.
+
+    Returns:
+        Callable | None: A função `_grafo_ext.caminhos_em_arestas`, ou None se a
+        extensão não tiver sido compilada (ver `_grafo_ext_build.py`).
+    """
+    if importlib.util.find_spec("_grafo_ext") is None:
+        return None
+
+    from _grafo_ext import caminhos_em_arestas
+
+    return caminhos_em_arestas
+
+
+@functools.lru_cache(maxsize=1)
+def _get_numpy() -> ModuleType | None:
+    """
+    Importa `numpy` sob demanda.
+
+    Returns:
+        ModuleType | None: O módulo `numpy`, ou None se ele não estiver instalado.
+    """
+    if importlib.util.find_spec("numpy") is None:
+        return None
+
+    import numpy
+
+    return numpy
+
+
+class CaminhosPlanos(NamedTuple):
+    """
+    Conjunto de caminhos guardado em arrays planos, sem um objeto por aresta.
+
+    O caminho `i` ocupa as posições `deslocamentos[i]:deslocamentos[i + 1]` de
+    `vertices` (ids dos vértices de cada passo) e de `pesos` (peso de cada passo).
+
+    Atributos:
+        nomes (list[str]): Nome de cada vértice, indexado pelo id.
+        vertices (array): Ids dos vértices de todos os caminhos, concatenados ('q').
+        pesos (array): Pesos das arestas de todos os caminhos, concatenados ('d').
+        deslocamentos (array): Início de cada caminho, mais o total no fim ('q').
+    """
+
+    nomes: list[str]
+    vertices: array
+    pesos: array
+    deslocamentos: array
+
+    def iterar(self) -> Iterator[CaminhoPossivel]:
+        """
+        Gera cada caminho como uma lista de tuplas (vértice, peso), convertendo os
+        ids em nomes apenas neste momento.
+        """
+        nomes, vertices, pesos, deslocamentos = self
+        for i in range(len(deslocamentos) - 1):
+            inicio, fim = deslocamentos[i], deslocamentos[i + 1]
+            yield [
+                (nomes[v], pesos[j]) for j, v in enumerate(vertices[inicio:fim], inicio)
+            ]
+
+    def somar_pesos(self) -> list[float]:
+        """
+        Calcula o peso total de cada caminho.
+
+        Cada trecho é somado com `math.fsum`. Com `numpy` e pesos inteiros cujas somas
+        cabem exatamente em um float, todas as somas saem de uma única chamada a
+        `np.add.reduceat`: nesse caso não há arredondamento e o resultado é o mesmo.
+
+        Returns:
+            list[float]: O peso total de cada caminho, na ordem dos caminhos.
+        """
+        _, _, pesos, deslocamentos = self
+        if (np := _get_numpy()) is not None and pesos:
+            valores = np.frombuffer(pesos, dtype=np.float64)
+            if np.abs(valores).sum() < 2**53 and np.all(np.trunc(valores) == valores):
+                limites = np.frombuffer(deslocamentos, dtype=np.int64)
+                inicios = limites[:-1]
+                # `reduceat` não aceita trechos vazios (caminho de um vértice até ele
+                # mesmo): só os demais são somados, e os vazios ficam com 0
+                nao_vazios = inicios < limites[1:]
+                somas = np.zeros(len(inicios))
+                somas[nao_vazios] = np.add.reduceat(valores, inicios[nao_vazios])
+                return somas.tolist()
+
+        return [
+            math.fsum(pesos[inicio:fim])
+            for inicio, fim in zip(deslocamentos, deslocamentos[1:])
+        ]
+
+
+class GrafoCSR(NamedTuple):
+    """
+    Representação do grafo em formato CSR (compressed sparse row), com cada vértice
+    identificado por um inteiro de 0 a V - 1, na ordem de inserção.
+
+    Os destinos do vértice de id `i` são `indices[indptr[i]:indptr[i + 1]]`, em ordem
+    crescente de id, com os pesos correspondentes nas mesmas posições de `pesos`.
+
+    Atributos:
+        nomes (list[str]): Nome de cada vértice, indexado pelo id.
+        ids (dict[str, int]): Id de cada vértice, indexado pelo nome.
+        indptr (array): Início dos destinos de cada vértice ('q', tamanho V + 1).
+        indices (array): Id do destino de cada aresta ('q').
+        pesos (list[float]): Peso de cada aresta, como recebido em `add_aresta`.
+    """
+
+    nomes: list[str]
+    ids: dict[str, int]
+    indptr: array
+    indices: array
+    pesos: list[float]
 
 
 class Grafo:
     """
     Classe que representa um grafo direcionado e ponderado usando matriz de adjacência.
 
-    A matriz de adjacência é implementada como um dicionário de dicionários, onde:
-    - A chave externa representa o vértice de origem
-    - A chave interna representa o vértice de destino
-    - O valor representa o peso da aresta (ou None se não existir conexão)
+    A matriz de adjacência é esparsa e guardada em formato CSR: só as arestas que
+    existem ocupam memória, O(V + E) em vez de O(V²), e os vizinhos de cada vértice
+    ficam contíguos. As arestas adicionadas ficam pendentes até a próxima consulta,
+    quando são incorporadas de uma só vez (ver `obter_csr`).
+
+    Os índices ficam em `array('q')`, e não em arrays do `numpy`, para que o módulo
+    não dependa de pacotes externos e a busca em Python puro indexe inteiros nativos;
+    a extensão Cython opcional recebe esses mesmos arrays sem cópia. Os pesos ficam em
+    uma lista, preservando o tipo (int ou float) com que cada aresta foi adicionada.
 
     Atributos:
-        grafo (RepresentacaoGrafo): Matriz de adjacência do grafo.
+        grafo (MatrizSomenteLeitura): Matriz de adjacência do grafo, somente leitura.
     """
 
-    grafo: RepresentacaoGrafo
+    _nomes: list[str]
+    _ids: dict[str, int]
+    _indptr: array
+    _indices: array
+    _pesos: list[float]
+    _pendentes: list[tuple[int, int, float]]
+    _cache_topologica: dict[int, list[int] | None]
+    _cache_sufixos: dict[tuple[int, int], int]
+    _marcados_livres: threading.local
+    _matriz: MatrizSomenteLeitura | None
 
     def __init__(self, grafo: RepresentacaoGrafo | None = None) -> None:
         """
@@ -38,35 +182,75 @@ class Grafo:
             grafo (dict[str, dict[str, float]] | None, opcional): Dicionário inicial para o grafo.
                                                                   Se None, cria um grafo vazio.
         """
-        self.grafo = grafo or {}
+        self._nomes = []
+        self._ids = {}
+        self._indptr = array("q", [0])
+        self._indices = array("q")
+        self._pesos = []
+        self._pendentes = []
+        self._cache_topologica = {}
+        self._cache_sufixos = {}
+        self._marcados_livres = threading.local()
+        self._matriz = None
+
+        if grafo is None:
+            return
+
+        for vertice in grafo:
+            self.add_vertice(vertice)
+        for origem, destinos in grafo.items():
+            for destino, peso in destinos.items():
+                if peso is not None:
+                    self.add_aresta(origem, destino, peso)
+
+    @property
+    def grafo(self) -> MatrizSomenteLeitura:
+        """
+        Matriz de adjacência completa, com None onde não há aresta.
+
+        É montada em O(V²) no primeiro acesso e reaproveitada até a próxima chamada a
+        `add_vertice` ou `add_aresta`; os métodos da classe usam a representação CSR.
+        A matriz é somente leitura (`MappingProxyType`): atribuir a uma de suas
+        posições levanta `TypeError`, e as arestas devem ser alteradas com `add_aresta`.
+        """
+        if self._matriz is None:
+            nomes, _, indptr, indices, pesos = self.obter_csr()
+            matriz: dict[str, Mapping[str, float | None]] = {}
+            for u, origem in enumerate(nomes):
+                linha = dict.fromkeys(nomes)
+                for j in range(indptr[u], indptr[u + 1]):
+                    linha[nomes[indices[j]]] = pesos[j]
+                matriz[origem] = MappingProxyType(linha)
+            self._matriz = MappingProxyType(matriz)
+        return self._matriz
 
     def add_vertice(self, vertice: str) -> None:
         """
         Adiciona um novo vértice ao grafo se ele ainda não existir.
 
-        Este método atualiza a matriz de adjacência adicionando uma nova linha e coluna
-        para o novo vértice, inicializando todas as conexões como None.
+        O novo vértice recebe o próximo id e uma linha vazia na matriz, sem alterar as
+        linhas dos demais vértices.
 
         Args:
             vertice (str): Nome do vértice a ser adicionado.
         """
-        if vertice in self.grafo.keys():
+        if vertice in self._ids:
             return
 
-        # Atualizar os outros vertices. Adicionar o novo vertice sendo criado e colocar None
-        for _, v in self.grafo.items():
-            v.update({vertice: None})
-
-        # Criar o vertice atual e colocar os vertices anteriores nas chaves dele
-        self.grafo[vertice] = {vertice: None}
-        self.grafo[vertice].update({k: None for k in self.grafo.keys()})
+        self._ids[vertice] = len(self._nomes)
+        self._nomes.append(vertice)
+        self._indptr.append(self._indptr[-1])
+        self._cache_topologica = {}
+        self._cache_sufixos = {}
+        self._matriz = None
 
     def add_aresta(self, origem: str, destino: str, peso: float) -> None:
         """
         Adiciona uma aresta direcionada com peso entre dois vértices.
 
         O método cria uma conexão de origem para destino com o peso especificado.
-        Não cria automaticamente a conexão inversa (de destino para origem).
+        Não cria automaticamente a conexão inversa (de destino para origem). Se a
+        aresta já existir, seu peso é substituído.
 
         Args:
             origem (str): Vértice de origem da aresta.
@@ -76,18 +260,167 @@ class Grafo:
         Raises:
             RuntimeError: Se qualquer um dos vértices não existir no grafo.
         """
-        if origem not in self.grafo.keys():
+        if origem not in self._ids:
             raise RuntimeError("O vértice de origem não foi encontrado no grafo.")
 
-        if destino not in self.grafo.keys():
+        if destino not in self._ids:
             raise RuntimeError("O vértice de destino não foi encontrado no grafo.")
 
-        self.grafo[origem][destino] = peso
+        self._pendentes.append((self._ids[origem], self._ids[destino], peso))
+        self._matriz = None
+
+    def obter_csr(self) -> GrafoCSR:
+        """
+        Retorna a representação CSR do grafo, incorporando antes as arestas pendentes.
+
+        As arestas pendentes e as já existentes são reordenadas por (origem, destino)
+        e os arrays são reconstruídos uma única vez, em O(E log E), não importa
+        quantas arestas tenham sido adicionadas desde a última consulta. Os caches
+        que dependem das arestas (ordens topológicas e contagens de caminhos) são
+        esvaziados nesse momento.
+
+        Returns:
+            GrafoCSR: Os ids dos vértices e os arrays CSR das arestas.
+        """
+        if self._pendentes:
+            # Arestas existentes primeiro, para que as pendentes substituam seus pesos
+            arestas = {
+                (u, self._indices[j]): self._pesos[j]
+                for u in range(len(self._nomes))
+                for j in range(self._indptr[u], self._indptr[u + 1])
+            }
+            arestas.update(((u, v), peso) for u, v, peso in self._pendentes)
+            self._pendentes = []
+
+            indptr = array("q", bytes(8 * (len(self._nomes) + 1)))
+            indices = array("q")
+            pesos: list[float] = []
+            for (u, v), peso in sorted(arestas.items()):
+                indptr[u + 1] += 1
+                indices.append(v)
+                pesos.append(peso)
+            for u in range(len(self._nomes)):
+                indptr[u + 1] += indptr[u]
+
+            self._indptr = indptr
+            self._indices = indices
+            self._pesos = pesos
+            self._cache_topologica = {}
+            self._cache_sufixos = {}
+
+        return GrafoCSR(
+            self._nomes, self._ids, self._indptr, self._indices, self._pesos
+        )
+
+    def _ordem_topologica(self, id_origem: int) -> list[int] | None:
+        """
+        Ordena topologicamente os vértices alcançáveis a partir de `id_origem`.
+
+        Args:
+            id_origem (int): Id do vértice de origem.
+
+        Returns:
+            list[int] | None: Os ids alcançáveis em ordem topológica, ou None se houver
+            um ciclo alcançável a partir da origem. O resultado fica em cache até o
+            grafo ser alterado.
+        """
+        if id_origem in self._cache_topologica:
+            return self._cache_topologica[id_origem]
+
+        _, _, indptr, indices, _ = self.obter_csr()
+
+        # 0: não visitado, 1: na pilha da busca, 2: concluído
+        estado = bytearray(len(indptr) - 1)
+        estado[id_origem] = 1
+        pos_ordem: list[int] = []
+        pilha = [(id_origem, iter(range(indptr[id_origem], indptr[id_origem + 1])))]
+
+        ordem: list[int] | None = None
+        while pilha:
+            u, arestas = pilha[-1]
+            j = next(arestas, None)
+            if j is None:
+                pilha.pop()
+                estado[u] = 2
+                pos_ordem.append(u)
+                continue
+
+            v = indices[j]
+            # Aresta para um vértice ainda na pilha: há um ciclo
+            if estado[v] == 1:
+                break
+            if estado[v] == 0:
+                estado[v] = 1
+                pilha.append((v, iter(range(indptr[v], indptr[v + 1]))))
+        else:
+            pos_ordem.reverse()
+            ordem = pos_ordem
+
+        self._cache_topologica[id_origem] = ordem
+        return ordem
+
+    def _contar_sufixos(self, ordem: list[int], id_destino: int) -> None:
+        """
+        Preenche `_cache_sufixos` com o número de caminhos de cada vértice de `ordem`
+        até `id_destino`, por programação dinâmica.
+
+        Como `ordem` é topológica e acíclica, o número de caminhos de `u` é a soma do
+        número de caminhos dos destinos das suas arestas, já calculados por virem
+        depois na ordem. Guardar só as contagens mantém o cache em O(V), qualquer que
+        seja o número de caminhos.
+
+        Args:
+            ordem (list[int]): Vértices em ordem topológica (ver `_ordem_topologica`).
+            id_destino (int): Id do vértice de destino.
+        """
+        _, _, indptr, indices, _ = self.obter_csr()
+        cache = self._cache_sufixos
+
+        for u in reversed(ordem):
+            if (u, id_destino) in cache:
+                continue
+            if u == id_destino:
+                cache[(u, id_destino)] = 1
+                continue
+            cache[(u, id_destino)] = sum(
+                cache[(indices[j], id_destino)] for j in range(indptr[u], indptr[u + 1])
+            )
+
+    def _reservar_marcados(self) -> bytearray:
+        """
+        Obtém um vetor de visitados zerado, com um byte por vértice.
+
+        Reaproveita o vetor devolvido pela última busca da mesma thread
+        (`_devolver_marcados`), se ele ainda tiver o tamanho certo, em vez de alocar
+        um novo a cada consulta. O vetor fica reservado até ser devolvido, então
+        buscas simultâneas (como dois geradores em andamento) nunca o compartilham.
+
+        Returns:
+            bytearray: Vetor de tamanho V com todos os bytes em 0.
+        """
+        marcados = getattr(self._marcados_livres, "marcados", None)
+        if marcados is None or len(marcados) != len(self._nomes):
+            return bytearray(len(self._nomes))
+
+        self._marcados_livres.marcados = None
+        return marcados
+
+    def _devolver_marcados(self, marcados: bytearray) -> None:
+        """
+        Devolve um vetor obtido com `_reservar_marcados` para ser reaproveitado.
+
+        Args:
+            marcados (bytearray): O vetor, que deve estar com todos os bytes em 0.
+        """
+        self._marcados_livres.marcados = marcados
 
     def obter_peso_vertices_adjacentes(self, origem: str, destino: str) -> float | None:
         """
         Obtém o peso da aresta entre dois vértices adjacentes.
 
+        Os destinos de cada vértice estão ordenados por id, então a aresta é
+        localizada por busca binária.
+
         Args:
             origem (str): Vértice de origem.
             destino (str): Vértice de destino.
@@ -98,13 +431,18 @@ class Grafo:
         Raises:
             RuntimeError: Se a origem não existir ou os vértices não forem adjacentes.
         """
-        if origem not in self.grafo.keys():
+        if origem not in self._ids:
             raise RuntimeError("A origem não foi cadastrada.")
 
-        if destino not in self.grafo[origem] or self.grafo[origem][destino] is None:
-            raise RuntimeError("Os vértices não são adjacentes.")
+        _, ids, indptr, indices, pesos = self.obter_csr()
+        if destino in ids:
+            u = ids[origem]
+            v = ids[destino]
+            j = bisect.bisect_left(indices, v, indptr[u], indptr[u + 1])
+            if j < indptr[u + 1] and indices[j] == v:
+                return pesos[j]
 
-        return self.grafo[origem][destino]
+        raise RuntimeError("Os vértices não são adjacentes.")
 
     def visualizar(self) -> None:
         """
@@ -115,38 +453,31 @@ class Grafo:
         - As colunas representam os vértices de destino
         - As células contêm o peso da aresta ou "-" se não houver conexão
 
-        Limpa a tela antes de exibir o grafo.
+        Limpa a tela antes de exibir o grafo. O texto é montado por inteiro e escrito
+        de uma só vez.
         """
         import os
 
         os.system("cls" if os.name == "nt" else "clear")
 
-        vertices = list(self.grafo.keys())
-
-        # Imprime o cabeçalho com os nomes dos vértices
-        print("    ", end="")
-        for v in vertices:
-            print(f"{v:^5}", end="")
-        print()
-
-        # Imprime a linha separadora
-        print("    " + "-----" * len(vertices))
-
-        # Imprime cada linha da matriz
-        for origem in vertices:
-            print(f"{origem} | ", end="")
-            for destino in vertices:
-                # Verifica se existe uma aresta entre origem e destino
-                if (
-                    destino in self.grafo[origem]
-                    and self.grafo[origem][destino] is not None
-                ):
-                    # Imprime o peso da aresta
-                    print(f"{self.grafo[origem][destino]:^5}", end="")
-                else:
-                    # Imprime um indicador de que não há aresta
-                    print("  -  ", end="")
-            print()
+        vertices, _, indptr, indices, pesos = self.obter_csr()
+
+        # Cabeçalho com os nomes dos vértices e linha separadora
+        partes = [
+            "    " + "".join(f"{v:^5}" for v in vertices) + "\n",
+            "    " + "-----" * len(vertices) + "\n",
+        ]
+
+        # Cada linha da matriz, com o peso da aresta ou "-" se não houver conexão
+        for u, origem in enumerate(vertices):
+            # Só as arestas existentes são percorridas; as demais células ficam com "-"
+            celulas = ["  -  "] * len(vertices)
+            for j in range(indptr[u], indptr[u + 1]):
+                celulas[indices[j]] = f"{pesos[j]:^5}"
+            partes.append(f"{origem} | " + "".join(celulas) + "\n")
+
+        # Escrever a matriz inteira de uma só vez
+        sys.stdout.write("".join(partes))
 
     def calcular_caminhos_possiveis(
         self,
@@ -158,106 +489,295 @@ class Grafo:
         """
         Calcula todos os caminhos possíveis entre dois vértices usando busca em profundidade.
 
-        O algoritmo utiliza uma abordagem recursiva de busca em profundidade (DFS) para
-        encontrar todos os caminhos possíveis sem ciclos entre os vértices de origem e destino.
+        Materializa em uma lista os caminhos de `iter_caminhos_possiveis`, que descreve
+        a busca e os argumentos.
 
         Args:
             origem (str): Vértice de origem.
             destino (str): Vértice de destino.
             caminho_atual (list[DestinoEPeso] | None): Lista de vértices e pesos
-                                                     no caminho atual. Padrão é None.
+                                                     que antecedem a origem. Padrão é None.
             visitados (set[str] | None): Conjunto de vértices já visitados. Padrão é None.
 
         Returns:
             list[CaminhoPossivel]: Lista de todos os caminhos possíveis entre origem e destino.
                                      Cada caminho é uma lista de tuplas (vértice, peso).
         """
+        return list(
+            self.iter_caminhos_possiveis(origem, destino, caminho_atual, visitados)
+        )
+
+    def iter_caminhos_possiveis(
+        self,
+        origem: str,
+        destino: str,
+        caminho_atual: list[DestinoEPeso] | None = None,
+        visitados: set[str] | None = None,
+    ) -> Iterator[CaminhoPossivel]:
+        """
+        Gera todos os caminhos possíveis entre dois vértices usando busca em profundidade.
+        Os caminhos são produzidos à medida que são encontrados, sem materializar a
+        lista completa, que pode crescer exponencialmente. A busca em si é feita por
+        `_caminhos_em_arestas`; aqui as arestas são apenas convertidas em nomes.
+
+        Args:
+            origem (str): Vértice de origem.
+            destino (str): Vértice de destino.
+            caminho_atual (list[DestinoEPeso] | None): Lista de vértices e pesos
+                                                     que antecedem a origem. Padrão é None.
+                                                     Não é alterada.
+            visitados (set[str] | None): Conjunto de vértices já visitados. Padrão é None.
+                                         Ao final, contém também a origem.
+
+        Returns:
+            Iterator[CaminhoPossivel]: Iterador sobre os caminhos possíveis entre origem e
+                                       destino. Cada caminho é uma lista nova de tuplas
+                                       (vértice, peso).
+        """
         # Inicializar valores padrão
-        caminho_atual = caminho_atual or []
+        if caminho_atual is None:
+            caminho_atual = []
 
-        visitados = visitados or set()
+        if visitados is None:
+            visitados = set()
 
-        # Registrar o vértice atual como visitado
+        # Registrar a origem como visitada
         visitados.add(origem)
 
-        # Se chegamos ao destino, retornamos o caminho atual como um único caminho em uma lista
+        # Se a origem já é o destino, o caminho atual é o único caminho
         if origem == destino:
-            return [caminho_atual]
+            yield caminho_atual.copy()
+            return
 
-        # Lista para armazenar todos os caminhos encontrados
-        caminhos: list[CaminhoPossivel] = []
+        nomes, _, _, indices, pesos = self.obter_csr()
+        for arestas in self._caminhos_em_arestas(origem, destino, visitados):
+            yield caminho_atual + [(nomes[indices[k]], pesos[k]) for k in arestas]
 
-        # Explorar todos os vértices adjacentes
-        for proximo_destino in self.grafo[origem]:
-            peso = self.grafo[origem][proximo_destino]
-            # Ignorar vértices sem conexão (peso None)
-            if peso is None:
-                continue
+    def calcular_caminhos_planos(self, origem: str, destino: str) -> CaminhosPlanos:
+        """
+        Calcula todos os caminhos possíveis entre dois vértices, guardando-os em arrays
+        planos (ver `CaminhosPlanos`) em vez de uma lista de listas de tuplas.
 
-            # Verificar se o vértice já foi visitado para evitar ciclos
-            if proximo_destino in visitados:
-                continue
+        Como todos os caminhos são materializados de qualquer forma, se a extensão
+        Cython `_grafo_ext` tiver sido compilada a busca é feita de uma só vez por ela
+        (ver `_grafo_ext.pyx`); sem ela, os caminhos vêm de `_caminhos_em_arestas`.
+
+        Args:
+            origem (str): Vértice de origem.
+            destino (str): Vértice de destino.
 
-            # Chamada recursiva para continuar a partir do próximo destino
-            caminhos_encontrados = self.calcular_caminhos_possiveis(
-                origem=proximo_destino.upper(),
-                destino=destino.upper(),
-                caminho_atual=caminho_atual + [(proximo_destino, peso)],
-                visitados=visitados.copy(),
+        Returns:
+            CaminhosPlanos: Os ids e pesos de todos os caminhos, com os deslocamentos de
+            cada um. Se origem e destino forem iguais, contém apenas o caminho vazio.
+        """
+        nomes, ids, indptr, indices, pesos = self.obter_csr()
+        vertices_planos = array("q")
+        pesos_planos = array("d")
+        deslocamentos = array("q", [0])
+
+        if origem == destino:
+            deslocamentos.append(0)
+        elif (caminhos_em_arestas := _get_caminhos_ext()) is not None:
+            arestas, deslocamentos = caminhos_em_arestas(
+                indptr,
+                indices,
+                ids[origem],
+                ids.get(destino, -1),
+                bytearray(len(nomes)),
             )
+            vertices_planos.extend([indices[k] for k in arestas])
+            pesos_planos.extend([pesos[k] for k in arestas])
+        else:
+            for arestas in self._caminhos_em_arestas(origem, destino, {origem}):
+                vertices_planos.extend([indices[k] for k in arestas])
+                pesos_planos.extend([pesos[k] for k in arestas])
+                deslocamentos.append(len(vertices_planos))
 
-            # Adicionar os caminhos encontrados à lista de caminhos
-            caminhos.extend(caminhos_encontrados)
+        return CaminhosPlanos(nomes, vertices_planos, pesos_planos, deslocamentos)
 
-        return caminhos
+    def _caminhos_em_arestas(
+        self, origem: str, destino: str, visitados: set[str]
+    ) -> Iterator[Sequence[int]]:
+        """
+        Gera os caminhos simples de `origem` até `destino` (diferentes entre si) como
+        sequências de posições CSR de arestas (ver `obter_csr`).
+
+        O algoritmo utiliza uma busca em profundidade (DFS) iterativa, com uma pilha
+        explícita, sem depender do limite de recursão do Python em grafos profundos.
+        A busca só compara ids inteiros: os visitados ficam em um vetor de bytes
+        indexado pelo id e o caminho atual é uma lista de posições de arestas,
+        alterada no lugar ao descer e restaurada ao voltar.
+
+        Quando nenhum vértice além da origem é dado em `visitados`, o número de
+        caminhos de cada vértice até o destino é memorizado (ver `_contar_sufixos`)
+        sempre que a parte do grafo alcançável a partir dele é acíclica: a busca não
+        desce pelos vértices que não levam ao destino, de modo que, se toda a parte
+        alcançável a partir da origem for acíclica, cada descida produz ao menos um
+        caminho. Os caminhos continuam sendo gerados um a um; a extensão Cython, que
+        só retorna ao final, fica para `calcular_caminhos_planos`.
 
-    def mostrar_caminhos_possiveis(self, caminhos: list[CaminhoPossivel]) -> None:
+        Args:
+            origem (str): Vértice de origem.
+            destino (str): Vértice de destino.
+            visitados (set[str]): Vértices que os caminhos não podem usar.
+
+        Returns:
+            Iterator[Sequence[int]]: As posições das arestas de cada caminho.
+        """
+        _, ids, indptr, indices, _ = self.obter_csr()
+        u = ids[origem]
+        id_destino = ids.get(destino, -1)
+
+        # As contagens memorizadas só valem se nenhum vértice foi bloqueado pelo chamador
+        memorizar = visitados <= {origem}
+        sufixos = self._cache_sufixos if memorizar else {}
+        if memorizar and id_destino >= 0:
+            ordem = self._ordem_topologica(u)
+            if ordem is not None:
+                self._contar_sufixos(ordem, id_destino)
+
+        # Vértices visitados: um byte por id, 1 se o vértice está no caminho. O vetor
+        # é reaproveitado entre buscas (ver `_reservar_marcados`)
+        marcados = self._reservar_marcados()
+        bloqueados = [ids[vertice] for vertice in visitados if vertice in ids]
+        for i in bloqueados:
+            marcados[i] = 1
+
+        # Pilha de (id do vértice, iterador sobre as posições CSR das suas arestas)
+        pilha = [(u, iter(range(indptr[u], indptr[u + 1])))]
+
+        try:
+            # Arestas usadas para chegar a cada vértice do caminho atual
+            caminho: list[int] = []
+
+            # Métodos usados a cada aresta, resolvidos uma única vez
+            empilhar = pilha.append
+            desempilhar = pilha.pop
+            avancar = caminho.append
+            recuar = caminho.pop
+            contar_sufixos = sufixos.get
+
+            while pilha:
+                u, arestas = pilha[-1]
+                j = next(arestas, None)
+
+                # Arestas esgotadas: retroceder, desfazendo a visita
+                if j is None:
+                    desempilhar()
+                    marcados[u] = 0
+                    if pilha:
+                        recuar()
+                    continue
+
+                v = indices[j]
+
+                # Verificar se o vértice já foi visitado para evitar ciclos
+                if marcados[v]:
+                    continue
+
+                # Se chegamos ao destino, produzimos o caminho e não descemos
+                if v == id_destino:
+                    yield (*caminho, j)
+                    continue
+
+                # Não descer por vértices que sabidamente não levam ao destino
+                if contar_sufixos((v, id_destino)) == 0:
+                    continue
+
+                # Descer para o próximo destino
+                avancar(j)
+                marcados[v] = 1
+                empilhar((v, iter(range(indptr[v], indptr[v + 1]))))
+        finally:
+            # Desfazer as marcas restantes (bloqueios do chamador e, se a iteração foi
+            # interrompida, o caminho em andamento) antes de devolver o vetor
+            for i in bloqueados:
+                marcados[i] = 0
+            for i, _ in pilha:
+                marcados[i] = 0
+            self._devolver_marcados(marcados)
+
+    def mostrar_caminhos_possiveis(
+        self,
+        caminhos: Iterable[CaminhoPossivel] | CaminhosPlanos,
+        origem: str | None = None,
+    ) -> None:
         """
         Exibe todos os caminhos possíveis entre dois vértices, com seus respectivos pesos.
 
         Para cada caminho, exibe a sequência de vértices, o peso de cada aresta,
-        e o peso total do caminho.
+        e o peso total do caminho. Os caminhos podem vir de um gerador (como
+        `iter_caminhos_possiveis`), e são exibidos à medida que são produzidos; nesse
+        caso a quantidade de caminhos é exibida ao final. Com `CaminhosPlanos`, os
+        pesos totais de todos os caminhos são calculados de uma vez antes da exibição
+        (ver `CaminhosPlanos.somar_pesos`).
 
         Args:
-            caminhos (CaminhoPossivel): Lista de caminhos a serem exibidos.
-                                       Cada caminho é uma lista de tuplas (vértice, peso).
+            caminhos (Iterable[CaminhoPossivel] | CaminhosPlanos): Caminhos a serem exibidos.
+                                       Cada caminho é uma lista de tuplas (vértice, peso),
+                                       ou o resultado de `calcular_caminhos_planos`.
+            origem (str | None, opcional): Vértice de origem dos caminhos, que não faz
+                                           parte deles. Se None, é deduzido de cada
+                                           caminho por exclusão.
         """
         import os
 
         os.system("cls" if os.name == "nt" else "clear")
 
-        if not caminhos:
-            print("Não foram encontrados caminhos entre os vértices especificados.")
-            return
+        # Caminhos planos e listas têm a quantidade conhecida antes da exibição
+        quantidade: int | None = None
+        totais: Iterator[float] | None = None
+        if isinstance(caminhos, CaminhosPlanos):
+            quantidade = len(caminhos.deslocamentos) - 1
+            totais = iter(caminhos.somar_pesos())
+            caminhos = caminhos.iterar()
+        elif isinstance(caminhos, Sized):
+            quantidade = len(caminhos)
+
+        if quantidade is not None:
+            if quantidade == 0:
+                print("Não foram encontrados caminhos entre os vértices especificados.")
+                return
+
+            print(f"\nCaminhos possíveis encontrados: {quantidade}")
 
-        print(f"\nCaminhos possíveis encontrados: {len(caminhos)}")
+        total = 0
+        for total, caminho in enumerate(caminhos, 1):
+            # Peso total já calculado para os caminhos planos
+            peso_total = next(totais) if totais is not None else 0
 
-        for i, caminho in enumerate(caminhos, 1):
-            print(f"Caminho {i}:", end=" ")
+            print(f"Caminho {total}:", end=" ")
 
             # Verificar se o caminho está vazio (origem = destino)
             if not caminho:
                 print("Origem e destino são o mesmo vértice.")
                 continue
 
-            # Obter o primeiro vértice do caminho
-            peso_total = 0
-
             # Imprimir o vértice de origem (que não está no caminho)
-            if len(caminho) > 0:
+            if origem is not None:
+                print(f"{origem} →", end=" ")
+            else:
                 # Encontramos o vértice de origem por exclusão
-                for v in self.grafo.keys():
-                    if v not in [dest for dest, _ in caminho]:
+                no_caminho = {dest for dest, _ in caminho}
+                for v in self._nomes:
+                    if v not in no_caminho:
                         print(f"{v} →", end=" ")
                         break
 
             # Imprimir o resto do caminho
-            for destino, peso in caminho:
-                print(f"{destino} ({peso}) →", end=" ")
-                peso_total += peso
+            for destino, _peso in caminho:
+                print(f"{destino} ({_peso}) →", end=" ")
+            if totais is None:
+                peso_total = sum(peso for _, peso in caminho)
 
             print(f"Peso total: {peso_total}")
 
+        if quantidade is None:
+            if total == 0:
+                print("Não foram encontrados caminhos entre os vértices especificados.")
+            else:
+                print(f"\nCaminhos possíveis encontrados: {total}")
+
 
 def ler_grafo_de_arquivo(nome_arquivo: str) -> Grafo:
     """
@@ -287,54 +807,62 @@ def ler_grafo_de_arquivo(nome_arquivo: str) -> Grafo:
         FileNotFoundError: Se o arquivo não for encontrado.
         ValueError: Se o formato do arquivo for inválido.
     """
-    g = Grafo()
-
-    with open(nome_arquivo, "r") as arquivo:
-        linhas = arquivo.readlines()
+    # Primeira passagem: separar as linhas de vértices e de arestas
+    vertices: list[str] = []
+    arestas: list[tuple[int, str]] = []
 
     # Estado para controlar o que estamos lendo
     estado = None
 
-    for numero_linha, linha in enumerate(linhas, 1):
-        linha = linha.strip()
-
-        # Ignorar linhas em branco ou comentários
-        if not linha or linha.startswith("#"):
-            continue
-
-        # Verificar seções
-        if linha == "VERTICES:":
-            estado = "vertices"
-            continue
-        elif linha == "ARESTAS:":
-            estado = "arestas"
-            continue
-
-        # Processar conteúdo baseado no estado atual
-        if estado == "vertices":
-            g.add_vertice(linha)
-        elif estado == "arestas":
-            partes = linha.split()
-            if len(partes) != 3:
-                raise ValueError(
-                    f"Formato inválido na linha {numero_linha}: '{linha}'. Use 'origem destino peso'"
-                )
-
-            origem, destino, peso_str = partes
-            try:
-                peso = float(peso_str)
-                g.add_aresta(origem=origem, destino=destino, peso=peso)
-            except ValueError:
-                raise ValueError(f"Peso inválido na linha {numero_linha}: '{peso_str}'")
-            except RuntimeError as e:
-                raise ValueError(
-                    f"Erro ao adicionar aresta na linha {numero_linha}: {e}"
-                )
+    with open(nome_arquivo, "r") as arquivo:
+        for numero_linha, linha in enumerate(arquivo, 1):
+            linha = linha.strip()
+
+            # Ignorar linhas em branco ou comentários
+            if not linha or linha.startswith("#"):
+                continue
+
+            # Verificar seções
+            if linha == "VERTICES:":
+                estado = "vertices"
+                continue
+            elif linha == "ARESTAS:":
+                estado = "arestas"
+                continue
+
+            # Guardar o conteúdo baseado no estado atual
+            if estado == "vertices":
+                vertices.append(linha)
+            elif estado == "arestas":
+                arestas.append((numero_linha, linha))
+
+    # Segunda passagem: todos os vértices primeiro, depois as arestas, que ficam
+    # pendentes e entram na representação CSR de uma só vez (ver `Grafo.obter_csr`)
+    g = Grafo()
+    for vertice in vertices:
+        g.add_vertice(vertice)
+
+    for numero_linha, linha in arestas:
+        partes = linha.split()
+        if len(partes) != 3:
+            raise ValueError(
+                f"Formato inválido na linha {numero_linha}: '{linha}'. Use 'origem destino peso'"
+            )
+
+        origem, destino, peso_str = partes
+        try:
+            peso = float(peso_str)
+            g.add_aresta(origem=origem, destino=destino, peso=peso)
+        except ValueError:
+            raise ValueError(f"Peso inválido na linha {numero_linha}: '{peso_str}'")
+        except RuntimeError as e:
+            raise ValueError(f"Erro ao adicionar aresta na linha {numero_linha}: {e}")
 
     # Verificar se o grafo tem pelo menos um vértice
-    if not g.grafo:
+    if not g._nomes:
         raise ValueError("Arquivo não contém vértices válidos")
 
+    g.obter_csr()
     return g
 
 
@@ -380,22 +908,18 @@ D E 2.5""")
         origem = input("\nDigite o vértice de origem: ").upper()
         destino = input("Digite o vértice de destino: ").upper()
 
-        caminhos = g.calcular_caminhos_possiveis(origem=origem, destino=destino)
-
-        soma = 0
-        for caminho in caminhos:
-            for _, peso in caminho:
-                soma += peso
+        caminhos = g.calcular_caminhos_planos(origem=origem, destino=destino)
 
-        print(soma)
+        # Os pesos planos estão na mesma ordem em que os caminhos são exibidos
+        print(sum(caminhos.pesos))
 
         print("Peso vertices adjacentes: ")
         print(g.obter_peso_vertices_adjacentes(origem, destino))
 
-        if not caminhos:
+        if len(caminhos.deslocamentos) == 1:
             print(f"Não foram encontrados caminhos de {origem} para {destino}.")
         else:
-            g.mostrar_caminhos_possiveis(caminhos)
+            g.mostrar_caminhos_possiveis(caminhos, origem)
 
     except ValueError as e:
         print(f"Erro no formato do arquivo: {e}")
@@ -1,82 +1,173 @@
-import random
+import functools
+import importlib.util
+from array import array
+from collections.abc import Callable
+from typing import Any
 
 
-def dfs(
-    grafo: dict[str, set[str]], origem: str, visitados: list[str], contador: int
-) -> int:
-    contador = contador + 1
-    visitados.append(origem)
-    for w in grafo[origem]:
-        if w not in visitados:
-            contador = dfs(grafo, w, visitados, contador)
-    return contador
+@functools.lru_cache(maxsize=1)
+def _get_dfs_numba() -> Callable[..., int] | None:
+    # Busca compilada com Numba (`_dfs_numba`), se o pacote estiver instalado
+    # e `_dfs_numba` puder ser importado (`trabalho1/` no `sys.path`)
+    if importlib.util.find_spec("numba") is None:
+        return None
+
+    try:
+        from _dfs_numba import dfs_csr
+    except ImportError:
+        return None
+
+    return dfs_csr
+
+
+@functools.lru_cache(maxsize=1)
+def _get_articulacao_numba() -> Callable[..., Any] | None:
+    # Tarjan compilado com Numba (`_dfs_numba`), se o pacote estiver instalado
+    # e `_dfs_numba` puder ser importado (`trabalho1/` no `sys.path`)
+    if importlib.util.find_spec("numba") is None:
+        return None
+
+    try:
+        from _dfs_numba import pontos_de_articulacao
+    except ImportError:
+        return None
+
+    return pontos_de_articulacao
 
 
 class Grafo:
     def __init__(self) -> None:
         self.adjacencias: dict[str, set[str]] = {}
+        self._quantidade_arestas = 0
+        self._csr: tuple[dict[str, int], array, array] | None = None
+
+    def _obter_csr(self) -> tuple[dict[str, int], array, array]:
+        # Ids inteiros e arrays CSR (indptr, indices), refeitos após cada add_aresta
+        if self._csr is None:
+            ids = {v: i for i, v in enumerate(self.adjacencias)}
+            indptr = array("q", [0])
+            indices = array("q")
+            for vizinhos in self.adjacencias.values():
+                indices.extend([ids[w] for w in vizinhos])
+                indptr.append(len(indices))
+            self._csr = (ids, indptr, indices)
+
+        return self._csr
+
+    def dfs(self, origem: str) -> int:
+        # Retorna o número de vértices alcançáveis a partir da origem (incluindo ela)
+        ids, indptr, indices = self._obter_csr()
+        visitados = bytearray(len(ids))
+
+        if (dfs_csr := _get_dfs_numba()) is not None:
+            import numpy as np
+
+            return dfs_csr(
+                np.frombuffer(indptr, dtype=np.int64),
+                np.frombuffer(indices, dtype=np.int64),
+                ids[origem],
+                np.frombuffer(visitados, dtype=np.uint8),
+            )
+
+        visitados[ids[origem]] = 1
+        pilha = [ids[origem]]
+        contador = 0
+        while pilha:
+            u = pilha.pop()
+            contador += 1
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if not visitados[v]:
+                    visitados[v] = 1
+                    pilha.append(v)
+
+        return contador
 
     def eh_conexo(self) -> bool:
-        if dfs(
-            self.adjacencias,
-            random.choice(list(self.adjacencias.keys())),
-            [],
-            0,
-        ):
-            return True
-
-        return False
+        return self.dfs(next(iter(self.adjacencias))) == len(self.adjacencias)
 
     def identificar_pontos_criticos(self) -> set[str]:
-        def dfs(
-            grafo: dict[str, set[str]],
-            origem: str,
-            visitados: set[str],
-            vertices_criticos: set[str],
-        ):
-            visitados.add(origem)
-            adjacencias = grafo[origem]
-            if len(adjacencias) > 1:
-                vertices_criticos.add(origem)
-
-            for w in adjacencias:
-                if w not in visitados:
-                    dfs(
-                        grafo,
-                        w,
-                        visitados=visitados,
-                        vertices_criticos=vertices_criticos,
-                    )
-
-        vertices_criticos: set[str] = {*()}
-        dfs(
-            self.adjacencias,
-            random.choice(list(self.adjacencias.keys())),
-            {*()},
-            vertices_criticos=vertices_criticos,
-        )
-
-        return vertices_criticos
+        # Pontos de articulação pelo algoritmo de Tarjan, em todas as componentes
+        ids, indptr, indices = self._obter_csr()
+        nomes = list(ids)
+
+        if (pontos_de_articulacao := _get_articulacao_numba()) is not None:
+            import numpy as np
+
+            criticos = pontos_de_articulacao(
+                np.frombuffer(indptr, dtype=np.int64),
+                np.frombuffer(indices, dtype=np.int64),
+            )
+            return {nomes[u] for u in np.flatnonzero(criticos)}
+
+        n = len(nomes)
+        disc = [-1] * n
+        low = [0] * n
+        pai = [-1] * n
+        proxima = [0] * n
+        criticos: set[str] = set()
+        tempo = 0
+
+        for raiz in range(n):
+            if disc[raiz] >= 0:
+                continue
+
+            disc[raiz] = low[raiz] = tempo
+            tempo += 1
+            proxima[raiz] = indptr[raiz]
+            pilha = [raiz]
+            filhos_da_raiz = 0
+
+            while pilha:
+                u = pilha[-1]
+                k = proxima[u]
+
+                # Arestas esgotadas: retroceder e propagar `low` para o pai
+                if k == indptr[u + 1]:
+                    pilha.pop()
+                    p = pai[u]
+                    if p >= 0:
+                        low[p] = min(low[p], low[u])
+                        if p != raiz and low[u] >= disc[p]:
+                            criticos.add(nomes[p])
+                    continue
+
+                proxima[u] = k + 1
+                v = indices[k]
+                if disc[v] < 0:
+                    # Aresta de árvore: descer para o filho
+                    pai[v] = u
+                    disc[v] = low[v] = tempo
+                    tempo += 1
+                    proxima[v] = indptr[v]
+                    pilha.append(v)
+                    if u == raiz:
+                        filhos_da_raiz += 1
+                elif v != pai[u]:
+                    # Aresta de retorno
+                    low[u] = min(low[u], disc[v])
+
+            if filhos_da_raiz >= 2:
+                criticos.add(nomes[raiz])
+
+        return criticos
 
     def add_aresta(self, v1: str, v2: str) -> None:
-        vertices_do_grafo = self.adjacencias.keys()
-
-        if v1 not in vertices_do_grafo:
-            self.adjacencias[v1] = {*()}
-
-        if v2 not in vertices_do_grafo:
-            self.adjacencias[v2] = {*()}
+        # Uma busca por vértice: `setdefault` cria o conjunto só se ele não existir
+        vizinhos_v1 = self.adjacencias.setdefault(v1, set())
+        if v2 in vizinhos_v1:
+            return
 
-        self.adjacencias[v1].add(v2)
-        self.adjacencias[v2].add(v1)
+        vizinhos_v1.add(v2)
+        self.adjacencias.setdefault(v2, set()).add(v1)
+        self._quantidade_arestas += 1
+        self._csr = None
 
     def calcular_ordem(self) -> int:
-        vertices_do_grafo = self.adjacencias.keys()
-        quantidade_vertices = len(vertices_do_grafo)
-        return quantidade_vertices
+        return len(self.adjacencias)
 
     def calcular_tamanho(self) -> int:
-        return sum(len(v) for v in self.adjacencias.values()) // 2
+        return self._quantidade_arestas
 
 
 g = Grafo()
@@ -99,4 +190,4 @@ print("Criticos: ")
 print(g.identificar_pontos_criticos())
 
 print("DFS que retorna num vertices visitados: ")
-print(dfs(g.adjacencias, "r", [], 0))
+print(g.dfs("r"))
@@ -0,0 +1,129 @@
+"""
+Núcleos das buscas em profundidade de `3p1.py` compilados com Numba: a contagem
+de vértices alcançáveis e os pontos de articulação (Tarjan).
+
+Operam sobre a representação CSR (`indptr`, `indices`) construída por
+`Grafo._obter_csr`, com pilhas de inteiros pré-alocadas no lugar da recursão e
+vetores de inteiros para o estado de cada vértice, para que toda a busca rode em
+código nativo. `cache=True` guarda a compilação em disco entre execuções.
+
+Este módulo importa `numba` no topo; `3p1.py` só o importa quando o pacote está
+instalado.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def dfs_csr(
+    indptr: np.ndarray, indices: np.ndarray, origem: int, visitados: np.ndarray
+) -> int:
+    """
+    Visita todos os vértices alcançáveis a partir de `origem` em um grafo CSR.
+
+    Args:
+        indptr (np.ndarray): Início das arestas de cada vértice (int64, V + 1).
+        indices (np.ndarray): Destino de cada aresta (int64).
+        origem (int): Id do vértice de origem.
+        visitados (np.ndarray): 1 para os vértices já visitados (uint8, V). Ao final,
+            contém também os vértices alcançados pela busca.
+
+    Returns:
+        int: Número de vértices visitados pela busca, incluindo a origem.
+    """
+    # Cada vértice entra na pilha no máximo uma vez
+    pilha = np.empty(indptr.shape[0] - 1, np.int64)
+    pilha[0] = origem
+    topo = 1
+    visitados[origem] = 1
+    contador = 0
+
+    while topo > 0:
+        topo -= 1
+        u = pilha[topo]
+        contador += 1
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if not visitados[v]:
+                visitados[v] = 1
+                pilha[topo] = v
+                topo += 1
+
+    return contador
+
+
+@njit(cache=True)
+def pontos_de_articulacao(indptr: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Encontra os pontos de articulação de um grafo não direcionado em formato CSR,
+    pelo algoritmo de Tarjan, em O(V + E).
+
+    Um vértice `u` é ponto de articulação se for a raiz de uma busca com dois ou
+    mais filhos, ou se não for raiz e tiver um filho `v` com `low[v] >= disc[u]`.
+    Todas as componentes do grafo são percorridas.
+
+    Args:
+        indptr (np.ndarray): Início das arestas de cada vértice (int64, V + 1).
+        indices (np.ndarray): Destino de cada aresta (int64), com cada aresta
+            presente nos dois sentidos.
+
+    Returns:
+        np.ndarray: 1 para os pontos de articulação e 0 para os demais (uint8, V).
+    """
+    n = indptr.shape[0] - 1
+    disc = np.full(n, -1, np.int64)
+    low = np.zeros(n, np.int64)
+    pai = np.full(n, -1, np.int64)
+    proxima = np.empty(n, np.int64)
+    pilha = np.empty(n, np.int64)
+    criticos = np.zeros(n, np.uint8)
+    tempo = 0
+
+    for raiz in range(n):
+        if disc[raiz] >= 0:
+            continue
+
+        disc[raiz] = tempo
+        low[raiz] = tempo
+        tempo += 1
+        proxima[raiz] = indptr[raiz]
+        pilha[0] = raiz
+        topo = 1
+        filhos_da_raiz = 0
+
+        while topo > 0:
+            u = pilha[topo - 1]
+            k = proxima[u]
+
+            # Arestas esgotadas: retroceder e propagar `low` para o pai
+            if k == indptr[u + 1]:
+                topo -= 1
+                p = pai[u]
+                if p >= 0:
+                    low[p] = min(low[p], low[u])
+                    if p != raiz and low[u] >= disc[p]:
+                        criticos[p] = 1
+                continue
+
+            proxima[u] = k + 1
+            v = indices[k]
+            if disc[v] < 0:
+                # Aresta de árvore: descer para o filho
+                pai[v] = u
+                disc[v] = tempo
+                low[v] = tempo
+                tempo += 1
+                proxima[v] = indptr[v]
+                pilha[topo] = v
+                topo += 1
+                if u == raiz:
+                    filhos_da_raiz += 1
+            elif v != pai[u]:
+                # Aresta de retorno
+                low[u] = min(low[u], disc[v])
+
+        if filhos_da_raiz >= 2:
+            criticos[raiz] = 1
+
+    return criticos